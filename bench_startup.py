@@ -0,0 +1,53 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+# Benchmark: wall time of a bot run that finds no news and exits, i.e. the
+# cold-start cost server.js pays for every click when there's nothing to post
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def empty_run(workdir):
+    """Run main.py once with no feeds configured and return its wall time in seconds"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, os.path.join(REPO_DIR, "main.py")],
+        cwd=workdir, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"main.py exited with {result.returncode}:\n{result.stderr}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bot startup on an empty run")
+    parser.add_argument("--runs", type=int, default=5, help="number of timed runs")
+    args = parser.parse_args()
+
+    # Run in a scratch directory so the benchmark doesn't touch real state files
+    workdir = tempfile.mkdtemp(prefix="bench_startup-")
+    try:
+        with open(os.path.join(workdir, "bot_config.json"), 'w') as f:
+            json.dump({"rss_feeds": []}, f)
+
+        # One untimed run to warm the OS file cache and create the state databases
+        empty_run(workdir)
+        timings = [empty_run(workdir) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"Empty-run startup over {args.runs} runs: "
+          f"median {statistics.median(timings) * 1000:.0f} ms, "
+          f"min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
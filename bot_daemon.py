@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Defaults used when the config doesn't specify daemon settings
+DEFAULT_DAEMON_PORT = 8765
+DEFAULT_RUN_INTERVAL_MINUTES = 60
+
+# How often the config file's mtime is checked (seconds)
+CONFIG_POLL_INTERVAL = 5
+
+
+class BotDaemon:
+    """Runs the bot on a timer inside one long-lived process
+
+    Everything the bot caches per process (Gemini model, posted-links index,
+    feed and generation caches, browser session) stays warm between runs.
+    bot_config.json is reloaded when its mtime changes, and a small HTTP
+    endpoint on 127.0.0.1 accepts trigger-now requests and reports status:
+
+        POST /trigger   start a run now (409 if one is already running)
+        GET  /status    JSON status of the daemon and the last run
+    """
+
+    def __init__(self, config_file, load_config, run_bot):
+        """
+        Args:
+            config_file: Path of the config file to watch
+            load_config: Callable returning the current config dict
+            run_bot: Callable running one bot cycle with a config dict
+        """
+        self.config_file = config_file
+        self.load_config = load_config
+        self.run_bot = run_bot
+        self.config = load_config()
+        self.config_mtime = self.read_config_mtime()
+        self.trigger_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.server = None
+        self.status_info = {
+            "started_at": datetime.now().isoformat(),
+            "running": False,
+            "runs": 0,
+            "last_run_started": None,
+            "last_run_finished": None,
+            "last_run_seconds": None,
+            "last_run_error": None
+        }
+        self.next_run_at = time.time()
+
+    def interval(self):
+        return self.config.get("daemon_interval_minutes", DEFAULT_RUN_INTERVAL_MINUTES) * 60
+
+    def read_config_mtime(self):
+        try:
+            return os.stat(self.config_file).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def reload_config_if_changed(self):
+        """Reload the config when the file's mtime changed, rescheduling the next run"""
+        mtime = self.read_config_mtime()
+        if mtime == self.config_mtime:
+            return
+        self.config_mtime = mtime
+        previous_interval = self.interval()
+        self.config = self.load_config()
+        if self.interval() != previous_interval:
+            self.next_run_at = self.next_run_at - previous_interval + self.interval()
+        print("🔄 Reloaded configuration")
+
+    def trigger(self):
+        """Ask for a run now; returns False if a run is already in progress"""
+        with self.lock:
+            if self.status_info["running"]:
+                return False
+        self.trigger_event.set()
+        return True
+
+    def status(self):
+        with self.lock:
+            status = dict(self.status_info)
+        status["next_run_at"] = datetime.fromtimestamp(self.next_run_at).isoformat()
+        return status
+
+    def run_once(self):
+        """Run one bot cycle, recording its outcome for /status"""
+        started = time.time()
+        with self.lock:
+            self.status_info["running"] = True
+            self.status_info["last_run_started"] = datetime.fromtimestamp(started).isoformat()
+        error = None
+        try:
+            self.run_bot(self.config)
+        except Exception as e:
+            error = str(e)
+            print(f"❌ Bot run crashed: {e}")
+        finally:
+            with self.lock:
+                self.status_info["running"] = False
+                self.status_info["runs"] += 1
+                self.status_info["last_run_finished"] = datetime.now().isoformat()
+                self.status_info["last_run_seconds"] = round(time.time() - started, 1)
+                self.status_info["last_run_error"] = error
+
+    def start_control_server(self):
+        """Serve the trigger / status endpoint on a background thread"""
+        daemon = self
+
+        class ControlHandler(BaseHTTPRequestHandler):
+            def send_json(self, code, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/status":
+                    self.send_json(200, daemon.status())
+                else:
+                    self.send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                if self.path != "/trigger":
+                    self.send_json(404, {"error": "not found"})
+                elif daemon.trigger():
+                    self.send_json(202, {"accepted": True, "status": daemon.status()})
+                else:
+                    self.send_json(409, {"accepted": False, "error": "a run is already in progress",
+                                         "status": daemon.status()})
+
+            def log_message(self, format, *args):
+                # Keep the bot's console output readable
+                pass
+
+        port = self.config.get("daemon_port", DEFAULT_DAEMON_PORT)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), ControlHandler)
+        threading.Thread(target=self.server.serve_forever, name="daemon-control", daemon=True).start()
+        print(f"🎛️ Daemon control endpoint on http://127.0.0.1:{port} (POST /trigger, GET /status)")
+
+    def serve_forever(self):
+        """Run the scheduler until stop() is called or the process is interrupted"""
+        self.start_control_server()
+        print(f"🕒 Running every {self.interval() / 60:g} minutes")
+        try:
+            while not self.stop_event.is_set():
+                self.reload_config_if_changed()
+                timeout = max(0, min(CONFIG_POLL_INTERVAL, self.next_run_at - time.time()))
+                triggered = self.trigger_event.wait(timeout)
+                if self.stop_event.is_set():
+                    break
+                if not triggered and time.time() < self.next_run_at:
+                    continue
+
+                self.trigger_event.clear()
+                self.run_once()
+                self.next_run_at = time.time() + self.interval()
+                print(f"🕒 Next run at {datetime.fromtimestamp(self.next_run_at).strftime('%H:%M:%S')}")
+        finally:
+            if self.server is not None:
+                self.server.shutdown()
+
+    def stop(self):
+        self.stop_event.set()
+        self.trigger_event.set()
@@ -0,0 +1,82 @@
+import heapq
+
+# Defaults used when the config doesn't specify candidate limits
+DEFAULT_POOL_SIZE = 500
+DEFAULT_RESERVE = 5
+
+
+class NewsItem:
+    """Compact record for one scored candidate; converted to a dict only once selected"""
+
+    __slots__ = ('title', 'explanation', 'link', 'score', 'base_score', 'category', 'pub_date')
+
+    def __init__(self, title, explanation, link, score, base_score, category, pub_date):
+        self.title = title
+        self.explanation = explanation
+        self.link = link
+        self.score = score
+        self.base_score = base_score
+        self.category = category
+        self.pub_date = pub_date
+
+    @classmethod
+    def from_record(cls, record, score):
+        """Rebuild a candidate carried over in the cursor pool with a fresh score"""
+        return cls(record['title'], record['explanation'], record['link'], score,
+                   record['base_score'], record['category'], record['pub_date'])
+
+    def as_dict(self, with_score=True):
+        record = {
+            'title': self.title,
+            'explanation': self.explanation,
+            'link': self.link,
+            'base_score': self.base_score,
+            'category': self.category,
+            'pub_date': self.pub_date
+        }
+        if with_score:
+            record['score'] = self.score
+        return record
+
+
+def score_key(item):
+    return item.score
+
+
+def top_candidates(items, k):
+    """The k highest-scoring items, ties in stream order
+
+    Same result as sorted(items, key=score, reverse=True)[:k] but holds only
+    k items at a time.
+    """
+    return heapq.nlargest(k, items, key=score_key)
+
+
+class CandidatePool:
+    """Keeps the best candidates by base score to carry over to the next run
+
+    collect() passes a stream through unchanged while holding at most `size`
+    items in a min-heap; records() returns them in their original stream order.
+    A size of 0 or less turns carry-over off.
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE):
+        self.size = size
+        self.heap = []
+        self.count = 0
+
+    def collect(self, items):
+        for item in items:
+            # Earlier items win base-score ties, matching the stream order
+            entry = (item.base_score, -self.count, item)
+            self.count += 1
+            if len(self.heap) < self.size:
+                heapq.heappush(self.heap, entry)
+            elif self.heap and entry[:2] > self.heap[0][:2]:
+                heapq.heapreplace(self.heap, entry)
+            yield item
+
+    def records(self):
+        """Pool entries as dicts without the per-run score, in stream order"""
+        return [item.as_dict(with_score=False)
+                for _, _, item in sorted(self.heap, key=lambda entry: -entry[1])]
@@ -0,0 +1,177 @@
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime
+
+# Screenshots and DOM snapshots, one subdirectory per run
+DEBUG_ARTIFACTS_DIR = 'debug_artifacts'
+
+# "off" captures nothing, "failure" only when a step fails, "verbose" at every step
+DEBUG_LEVELS = ("off", "failure", "verbose")
+
+# Defaults for the ring buffer shared by all runs
+DEFAULT_MAX_FILES = 60
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Captures waiting to be written; further captures are dropped while it is full
+QUEUE_SIZE = 16
+
+
+class DebugCapture:
+    """Opt-in screenshots and DOM snapshots written by a background thread
+
+    Artifacts go to debug_artifacts/<run_id>/<seq>-<step>.png|.html. After each
+    write the oldest files (across all runs) are deleted until the directory is
+    back under max_files and max_bytes.
+    """
+
+    def __init__(self, level="failure", root=DEBUG_ARTIFACTS_DIR, max_files=DEFAULT_MAX_FILES,
+                 max_bytes=DEFAULT_MAX_BYTES, run_id=None):
+        """
+        Args:
+            level: One of DEBUG_LEVELS
+            root: Directory holding every run's artifacts
+            max_files: Most artifact files kept across all runs
+            max_bytes: Most bytes kept across all runs
+            run_id: Name of this run's subdirectory; defaults to a timestamp and PID
+        """
+        if level not in DEBUG_LEVELS:
+            print(f"⚠️ Unknown debug capture level '{level}', using 'failure'")
+            level = "failure"
+        self.level = level
+        self.root = root
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.run_dir = os.path.join(root, self.run_id)
+        self.queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.seq = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def wants(self, failure):
+        """Whether a capture at this step should be taken at the configured level"""
+        return self.level == "verbose" or (self.level == "failure" and failure)
+
+    def capture(self, driver, step, failure=False):
+        """Queue a screenshot and DOM snapshot of the current page
+
+        The browser is read on the calling thread (WebDriver isn't thread
+        safe); encoding to disk and pruning happen on the writer thread.
+
+        Args:
+            driver: Selenium WebDriver instance
+            step: Short name of the step, used in the file name
+            failure: True when capturing because the step failed
+
+        Returns:
+            str: Path the screenshot will be written to, or None if nothing was captured
+        """
+        if not self.wants(failure):
+            return None
+
+        try:
+            screenshot = driver.get_screenshot_as_png()
+            dom = driver.page_source
+        except Exception as e:
+            print(f"⚠️ Debug capture failed at {step}: {e}")
+            return None
+
+        with self.lock:
+            self.seq += 1
+            base = os.path.join(self.run_dir, f"{self.seq:03d}-{step}")
+            self.start_writer()
+
+        try:
+            self.queue.put_nowait((base, screenshot, dom))
+        except queue.Full:
+            self.dropped += 1
+            return None
+        return base + ".png"
+
+    def start_writer(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.writer, name="debug-capture", daemon=True)
+            self.thread.start()
+
+    def writer(self):
+        while True:
+            base, screenshot, dom = self.queue.get()
+            try:
+                os.makedirs(self.run_dir, exist_ok=True)
+                with open(base + ".png", 'wb') as f:
+                    f.write(screenshot)
+                with open(base + ".html", 'w', encoding='utf-8') as f:
+                    f.write(dom)
+                self.prune()
+            except Exception as e:
+                print(f"⚠️ Error writing debug artifacts: {e}")
+            finally:
+                self.queue.task_done()
+
+    def prune(self):
+        """Delete the oldest artifacts until the ring buffer fits its file and byte caps"""
+        files = []
+        for dirpath, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, path, stat.st_size))
+        files.sort()
+
+        total = sum(size for _, _, size in files)
+        count = len(files)
+        for _, path, size in files:
+            if count <= self.max_files and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            count -= 1
+            total -= size
+
+        # Drop run directories that pruning emptied
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if path != self.run_dir and os.path.isdir(path) and not os.listdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def flush(self):
+        """Wait until every queued capture has been written"""
+        if self.thread is not None:
+            self.queue.join()
+        if self.dropped:
+            print(f"⚠️ Dropped {self.dropped} debug captures while the writer was busy")
+            self.dropped = 0
+
+
+# Capture for this process and the settings it was built from
+_debug_capture = None
+_debug_settings = None
+
+
+def get_debug_capture(settings=None):
+    """Return the process-wide capture, rebuilding it if its settings changed
+
+    Args:
+        settings: Dict with optional "level", "max_files" and "max_mb" keys
+    """
+    global _debug_capture, _debug_settings
+    settings = dict(settings or {})
+    if _debug_capture is None or settings != _debug_settings:
+        if _debug_capture is not None:
+            _debug_capture.flush()
+        _debug_capture = DebugCapture(
+            level=settings.get("level", "failure"),
+            max_files=settings.get("max_files", DEFAULT_MAX_FILES),
+            max_bytes=int(settings.get("max_mb", DEFAULT_MAX_BYTES / (1024 * 1024)) * 1024 * 1024),
+            run_id=_debug_capture.run_id if _debug_capture is not None else None
+        )
+        _debug_settings = settings
+    return _debug_capture
@@ -0,0 +1,136 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import subprocess
+
+# Resolved chromedriver path and the versions it was validated against
+DRIVER_PIN_FILE = 'chromedriver_pin.json'
+
+# Chrome executables to ask for a version, by platform
+CHROME_BINARIES = {
+    "linux": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"],
+    "darwin": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+               "/Applications/Chromium.app/Contents/MacOS/Chromium"]
+}
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+# Path resolved earlier in this process
+_resolved_path = None
+
+
+def run_version_command(command):
+    """Run a --version style command and return the version string it prints, or None"""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def local_chrome_version():
+    """Version of the locally installed Chrome, or None if it can't be determined"""
+    if sys.platform.startswith("win"):
+        return run_version_command(
+            ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"])
+
+    platform = "darwin" if sys.platform == "darwin" else "linux"
+    for binary in CHROME_BINARIES[platform]:
+        path = shutil.which(binary) or (binary if os.path.exists(binary) else None)
+        if path:
+            version = run_version_command([path, "--version"])
+            if version:
+                return version
+    return None
+
+
+def major_version(version):
+    return version.split(".")[0] if version else None
+
+
+def load_pin():
+    if not os.path.exists(DRIVER_PIN_FILE):
+        return None
+    try:
+        with open(DRIVER_PIN_FILE, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Error reading chromedriver pin: {e}")
+        return None
+
+
+def save_pin(path, driver_version, chrome_version):
+    try:
+        with open(DRIVER_PIN_FILE, 'w') as f:
+            json.dump({
+                "path": path,
+                "driver_version": driver_version,
+                "chrome_version": chrome_version,
+                "resolved_at": time.time()
+            }, f, indent=2)
+    except Exception as e:
+        print(f"⚠️ Error saving chromedriver pin: {e}")
+
+
+def invalidate_pin():
+    """Forget the pinned driver, e.g. after Chrome refused to start with it"""
+    global _resolved_path
+    _resolved_path = None
+    if os.path.exists(DRIVER_PIN_FILE):
+        os.remove(DRIVER_PIN_FILE)
+
+
+def matches_chrome(driver_version, chrome_version):
+    """A driver is usable when its major version matches Chrome's (or Chrome's is unknown)"""
+    return chrome_version is None or major_version(driver_version) == major_version(chrome_version)
+
+
+def resolve_chromedriver():
+    """Find a chromedriver matching the local Chrome, preferring offline sources
+
+    Order: the pinned path from an earlier run, a chromedriver on PATH, and only
+    then webdriver_manager, which needs the network. The result is pinned on
+    disk and reused for the rest of the process.
+
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    global _resolved_path
+    if _resolved_path:
+        return _resolved_path
+
+    started = time.monotonic()
+    chrome_version = local_chrome_version()
+    source = None
+
+    # 1. Pinned driver, still present and matching Chrome
+    pin = load_pin()
+    if pin and os.path.exists(pin.get("path", "")) and matches_chrome(pin.get("driver_version"), chrome_version):
+        path, driver_version, source = pin["path"], pin.get("driver_version"), "pinned"
+
+    # 2. A chromedriver already installed on this machine
+    if source is None:
+        path = shutil.which("chromedriver")
+        driver_version = run_version_command([path, "--version"]) if path else None
+        if path and driver_version and matches_chrome(driver_version, chrome_version):
+            source = "PATH"
+
+    # 3. Download through webdriver_manager (network)
+    if source is None:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        driver_version = run_version_command([path, "--version"])
+        source = "webdriver_manager"
+
+    if source != "pinned":
+        save_pin(path, driver_version, chrome_version)
+
+    _resolved_path = path
+    elapsed = time.monotonic() - started
+    print(f"🚗 Resolved chromedriver {driver_version or '?'} for Chrome {chrome_version or '?'} "
+          f"from {source} in {elapsed:.2f}s")
+    return path
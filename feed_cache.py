@@ -0,0 +1,131 @@
+import os
+import json
+import time
+import feedparser
+
+# On-disk cache of feed validators and parsed entries
+FEED_CACHE_FILE = 'feed_cache.json'
+
+# Entry fields kept in the cache; these are the only ones the ranking step reads
+CACHED_ENTRY_FIELDS = ('id', 'title', 'link', 'summary', 'published_parsed')
+
+
+def serialize_entry(entry):
+    """Convert a feedparser entry into a JSON-friendly dict"""
+    data = {}
+    for field in CACHED_ENTRY_FIELDS:
+        value = entry.get(field)
+        if value is None:
+            continue
+        if field == 'published_parsed':
+            value = list(value)
+        data[field] = value
+    return data
+
+
+def deserialize_entry(data):
+    """Rebuild a feedparser-style entry from its cached dict"""
+    entry = feedparser.FeedParserDict(data)
+    if 'published_parsed' in data:
+        entry['published_parsed'] = time.struct_time(tuple(data['published_parsed']))
+    return entry
+
+
+class FeedCache:
+    """Persistent cache of ETag / Last-Modified validators and parsed entries per feed"""
+
+    def __init__(self, path=FEED_CACHE_FILE, max_age=0):
+        """
+        Args:
+            path: JSON file the cache is stored in
+            max_age: Seconds a cached feed is used without asking the server (0 disables)
+        """
+        self.path = path
+        self.max_age = max_age
+        self.feeds = {}
+        self.stats = {"hit": 0, "miss": 0, "not_modified": 0}
+        self.load()
+
+    def load(self):
+        """Load the cache file, starting empty if it is missing or corrupt"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self.feeds = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading feed cache: {e}")
+            self.feeds = {}
+
+    def save(self):
+        """Write the cache atomically so a crash can't leave a half-written file"""
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.feeds, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Error saving feed cache: {e}")
+
+    def fresh_feed(self, feed_url):
+        """Return the cached feed if it is younger than max_age, else None"""
+        cached = self.feeds.get(feed_url)
+        if not cached or not self.max_age:
+            return None
+        if time.time() - cached.get("fetched_at", 0) > self.max_age:
+            return None
+        self.stats["hit"] += 1
+        return self.cached_feed(feed_url)
+
+    def conditional_headers(self, feed_url):
+        """Build If-None-Match / If-Modified-Since headers for a feed"""
+        cached = self.feeds.get(feed_url)
+        headers = {}
+        if not cached:
+            return headers
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
+        return headers
+
+    def cached_feed(self, feed_url):
+        """Return the cached entries for a feed as a feedparser-style result"""
+        cached = self.feeds.get(feed_url, {})
+        entries = [deserialize_entry(data) for data in cached.get("entries", [])]
+        return feedparser.FeedParserDict(entries=entries, status=304)
+
+    def not_modified(self, feed_url):
+        """Record a 304 response and return the cached feed"""
+        self.stats["not_modified"] += 1
+        self.feeds[feed_url]["fetched_at"] = time.time()
+        return self.cached_feed(feed_url)
+
+    def store(self, feed_url, feed, headers):
+        """Record a full download and cache its validators and entries"""
+        self.stats["miss"] += 1
+        self.feeds[feed_url] = {
+            "etag": headers.get("etag"),
+            "modified": headers.get("last-modified"),
+            "fetched_at": time.time(),
+            "entries": [serialize_entry(entry) for entry in feed.entries]
+        }
+
+    def report(self):
+        """Print the hit / miss / 304 counts since the last report, then reset them"""
+        print(f"📦 Feed cache: {self.stats['hit']} hits, {self.stats['miss']} misses, "
+              f"{self.stats['not_modified']} not modified")
+        self.stats = {"hit": 0, "miss": 0, "not_modified": 0}
+
+
+# Open caches, keyed by file path, so a long-running process keeps them in memory
+_caches = {}
+
+
+def get_feed_cache(max_age=0, path=FEED_CACHE_FILE):
+    """Return the shared cache for a file, applying the latest max_age"""
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = FeedCache(path, max_age=max_age)
+    cache.max_age = max_age
+    return cache
@@ -0,0 +1,90 @@
+import os
+import json
+import hashlib
+
+# Per-feed high-water marks and the candidate pool carried between runs
+FEED_CURSORS_FILE = 'feed_cursors.json'
+
+# Bump when the scoring logic changes so stale pools are rebuilt
+SCORING_VERSION = 2
+
+
+def scoring_fingerprint(config):
+    """Hash the config values that affect which entries become candidates and how they score"""
+    relevant = {
+        "version": SCORING_VERSION,
+        "priority_keywords": config.get("priority_keywords", []),
+        "keyword_weights": config.get("keyword_weights", {}),
+        "category_weights": config.get("category_weights", {}),
+        "max_news_age": config.get("max_news_age", 2)
+    }
+    encoded = json.dumps(relevant, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class FeedCursors:
+    """Persisted per-feed cursor (newest pub time + processed GUIDs) and scored candidate pool"""
+
+    def __init__(self, fingerprint, path=FEED_CURSORS_FILE):
+        """
+        Args:
+            fingerprint: scoring_fingerprint() of the current config
+            path: JSON file the cursors are stored in
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.feeds = {}
+        self.pool = []
+        self.load()
+
+    def load(self):
+        """Load saved cursors, discarding them if the scoring config changed"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading feed cursors: {e}")
+            return
+
+        if state.get("fingerprint") != self.fingerprint:
+            print("♻️ Scoring config changed, reprocessing all feed entries")
+            return
+
+        self.feeds = state.get("feeds", {})
+        self.pool = state.get("pool", [])
+
+    def is_new(self, feed_url, guid, pub_ts):
+        """Check whether an entry is past the feed's cursor and still needs processing"""
+        cursor = self.feeds.get(feed_url)
+        if not cursor:
+            return True
+        if pub_ts < cursor.get("newest", 0):
+            return False
+        return guid not in cursor.get("guids", ())
+
+    def advance(self, feed_url, guids, newest):
+        """Move a feed's cursor to cover everything seen in its latest fetch"""
+        cursor = self.feeds.get(feed_url, {})
+        self.feeds[feed_url] = {
+            "newest": max(newest, cursor.get("newest", 0)),
+            # Only GUIDs still present in the feed can reappear, so the set stays feed-sized
+            "guids": sorted(guids)
+        }
+
+    def save(self, pool):
+        """Persist cursors together with the candidate pool for the next run"""
+        self.pool = pool
+        state = {
+            "fingerprint": self.fingerprint,
+            "feeds": self.feeds,
+            "pool": pool
+        }
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Error saving feed cursors: {e}")
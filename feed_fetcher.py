@@ -0,0 +1,130 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+# Defaults used when the config doesn't specify fetch settings
+DEFAULT_FETCH_CONCURRENCY = 6
+DEFAULT_FEED_TIMEOUT = 10  # seconds per feed
+DEFAULT_FETCH_DEADLINE = 45  # seconds for the whole fetch stage
+
+# Read feeds in chunks so a slow body can't exceed the per-feed timeout
+CHUNK_SIZE = 64 * 1024
+
+
+def create_session(concurrency):
+    """Create an HTTP session sized for the fetch worker pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = feedparser.USER_AGENT
+    return session
+
+
+def download_feed(session, feed_url, timeout, headers=None):
+    """Download the raw body of a feed
+
+    Args:
+        session: requests.Session to reuse connections with
+        feed_url: URL of the RSS feed
+        timeout: Maximum seconds to spend on this feed
+        headers: Extra request headers, e.g. conditional GET validators
+
+    Returns:
+        tuple: (status code, body bytes, lowercased response headers dict)
+    """
+    started = time.monotonic()
+    with session.get(feed_url, timeout=timeout, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        chunks = []
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if time.monotonic() - started > timeout:
+                raise TimeoutError(f"feed took longer than {timeout}s")
+            chunks.append(chunk)
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        return response.status_code, b"".join(chunks), response_headers
+
+
+def fetch_feeds(feed_configs, concurrency=DEFAULT_FETCH_CONCURRENCY,
+                feed_timeout=DEFAULT_FEED_TIMEOUT, deadline=DEFAULT_FETCH_DEADLINE,
+                cache=None):
+    """Fetch RSS feeds concurrently and parse them as they arrive
+
+    Downloads run on a bounded thread pool so network waits overlap, while
+    parsing happens on the calling thread as each download completes, so a
+    large feed being parsed never holds up the downloads still in flight.
+
+    Args:
+        feed_configs: List of feed config dicts with 'url' and 'category'
+        concurrency: Maximum number of feeds downloaded at once
+        feed_timeout: Maximum seconds to spend on a single feed
+        deadline: Maximum seconds for the whole fetch stage
+        cache: Optional FeedCache used for conditional GETs and max-age hits
+
+    Returns:
+        list: Parsed feeds in the same order as feed_configs, with None for
+        feeds that failed or didn't finish before the deadline
+    """
+    results = [None] * len(feed_configs)
+    if not feed_configs:
+        return results
+
+    concurrency = max(1, int(concurrency))
+    started = time.monotonic()
+    session = create_session(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="feed")
+
+    try:
+        pending = {}
+        for index, feed_config in enumerate(feed_configs):
+            feed_url = feed_config.get("url")
+
+            # Feeds still within max-age skip the network entirely
+            if cache is not None:
+                cached = cache.fresh_feed(feed_url)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+
+            print(f"📰 Fetching feed: {feed_url}")
+            headers = cache.conditional_headers(feed_url) if cache is not None else None
+            future = executor.submit(download_feed, session, feed_url, feed_timeout, headers)
+            pending[future] = index
+
+        while pending:
+            remaining = deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                feed_url = feed_configs[index].get("url")
+                try:
+                    status, body, headers = future.result()
+                    if status == 304 and cache is not None:
+                        results[index] = cache.not_modified(feed_url)
+                        continue
+
+                    feed = feedparser.parse(body, response_headers=headers)
+                    if cache is not None:
+                        cache.store(feed_url, feed, headers)
+                    results[index] = feed
+                except Exception as e:
+                    print(f"⚠️ Error parsing feed {feed_url}: {e}")
+
+        for future, index in pending.items():
+            future.cancel()
+            print(f"⚠️ Feed {feed_configs[index].get('url')} missed the {deadline}s fetch deadline")
+
+    finally:
+        # Don't wait for stragglers past the deadline; their sockets time out on their own
+        executor.shutdown(wait=False, cancel_futures=True)
+        session.close()
+
+    fetched = sum(1 for feed in results if feed is not None)
+    elapsed = time.monotonic() - started
+    print(f"✅ Fetched {fetched}/{len(feed_configs)} feeds in {elapsed:.1f}s")
+    return results
@@ -0,0 +1,144 @@
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Call settings, overridable from the bot config via configure_gemini()
+SETTINGS = {
+    # Seconds a call may take before it is abandoned
+    "timeout": 30,
+    # Seconds after which a second, identical request is raced against the first (0 disables)
+    "hedge_after": 10,
+    # Consecutive failures that open the circuit breaker
+    "failure_threshold": 3,
+    # Seconds the breaker stays open before one trial call is let through
+    "cooldown": 300
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Gemini while the circuit breaker is open"""
+
+
+def configure_gemini(settings):
+    """Apply Gemini call settings from the bot config"""
+    SETTINGS.update(settings)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class GeminiClient:
+    """Deadline, hedging and circuit-breaker wrapper around a Gemini model
+
+    Each call runs on a worker thread and is abandoned at its deadline (the
+    request itself also gets the remaining time as its timeout). If the first
+    request is slow, a hedged duplicate is sent and whichever succeeds first
+    wins. After failure_threshold consecutive failures the breaker opens and
+    calls fail immediately with CircuitOpenError for cooldown seconds, so
+    callers go straight to their template fallback.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gemini")
+        self.lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.latencies = []
+        self.stats = {"calls": 0, "failures": 0, "timeouts": 0, "hedged": 0, "short_circuited": 0}
+
+    def record_success(self, latency):
+        with self.lock:
+            self.latencies.append(latency)
+            self.consecutive_failures = 0
+
+    def record_failure(self, timed_out):
+        with self.lock:
+            self.stats["failures"] += 1
+            if timed_out:
+                self.stats["timeouts"] += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= SETTINGS["failure_threshold"]:
+                self.open_until = time.monotonic() + SETTINGS["cooldown"]
+                print(f"⚡ Gemini circuit breaker open for {SETTINGS['cooldown']}s "
+                      f"after {self.consecutive_failures} consecutive failures")
+
+    def generate_content(self, prompt, **kwargs):
+        """Call model.generate_content with a deadline and optional hedge
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            TimeoutError: If no request succeeded before the deadline
+        """
+        with self.lock:
+            if time.monotonic() < self.open_until:
+                self.stats["short_circuited"] += 1
+                raise CircuitOpenError("Gemini circuit breaker is open")
+            self.stats["calls"] += 1
+
+        timeout = SETTINGS["timeout"]
+        started = time.monotonic()
+        deadline = started + timeout
+
+        def call():
+            remaining = max(1.0, deadline - time.monotonic())
+            return self.model.generate_content(prompt, request_options={"timeout": remaining}, **kwargs)
+
+        futures = {self.executor.submit(call)}
+        hedge_after = SETTINGS["hedge_after"]
+        if hedge_after and hedge_after < timeout:
+            done, _ = wait(futures, timeout=hedge_after)
+            if not done:
+                futures.add(self.executor.submit(call))
+                with self.lock:
+                    self.stats["hedged"] += 1
+
+        error = None
+        while futures:
+            done, futures = wait(futures, timeout=max(0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    self.record_success(time.monotonic() - started)
+                    return future.result()
+                error = future.exception()
+
+        self.record_failure(timed_out=error is None)
+        if error is not None:
+            raise error
+        raise TimeoutError(f"Gemini call exceeded its {timeout}s deadline")
+
+    def report(self):
+        """Print call latency percentiles and failure counts since the last report, then reset them"""
+        stats = self.stats
+        if self.latencies:
+            latencies = sorted(self.latencies)
+            timings = (f"p50 {percentile(latencies, 50):.1f}s, p90 {percentile(latencies, 90):.1f}s, "
+                       f"p99 {percentile(latencies, 99):.1f}s")
+        else:
+            timings = "no successful calls"
+        print(f"🔮 Gemini: {stats['calls']} calls ({timings}), {stats['failures']} failed "
+              f"({stats['timeouts']} timed out), {stats['hedged']} hedged, "
+              f"{stats['short_circuited']} skipped by the circuit breaker")
+        self.reset_stats()
+
+
+# Client shared by every call in this process
+_gemini_client = None
+
+
+def get_gemini_client(model):
+    """Return the process-wide client for a model"""
+    global _gemini_client
+    if _gemini_client is None or _gemini_client.model is not model:
+        _gemini_client = GeminiClient(model)
+    return _gemini_client
@@ -0,0 +1,100 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+# SQLite database of model-generated tweets
+GENERATION_CACHE_DB = 'generation_cache.db'
+
+# Defaults used when the config doesn't specify cache limits
+DEFAULT_CACHE_MAX_ENTRIES = 500
+DEFAULT_CACHE_TTL_HOURS = 72
+
+
+def generation_key(prompt_version, model_name, title, explanation, category):
+    """Content hash of everything that determines a generated tweet"""
+    payload = json.dumps([prompt_version, model_name, title, explanation, category or ""])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """Content-addressed cache of generated tweets with TTL and LRU eviction
+
+    Only real model outputs should be stored; template fallbacks produced
+    after a model error must not be put() so they get regenerated next time.
+    """
+
+    def __init__(self, path=GENERATION_CACHE_DB, max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+                 ttl_hours=DEFAULT_CACHE_TTL_HOURS):
+        """
+        Args:
+            path: SQLite database file
+            max_entries: Size cap; least recently used entries are evicted beyond it
+            ttl_hours: Hours a generation stays valid
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl_hours * 60 * 60
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "latency_saved": 0.0}
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS generations (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                latency REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_generations_last_used ON generations (last_used);
+        """)
+
+    def get(self, key):
+        """Return the cached tweet for a key, or None on a miss or expired entry"""
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT text, created_at, latency FROM generations WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.stats["misses"] += 1
+                return None
+
+            with self.conn:
+                self.conn.execute("UPDATE generations SET last_used = ? WHERE key = ?", (now, key))
+            self.stats["hits"] += 1
+            self.stats["latency_saved"] += row[2]
+            return row[0]
+
+    def put(self, key, text, latency):
+        """Store a model generation and evict expired / least recently used entries"""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO generations (key, text, created_at, last_used, latency) "
+                "VALUES (?, ?, ?, ?, ?)", (key, text, now, now, latency))
+            self.conn.execute("DELETE FROM generations WHERE created_at < ?", (now - self.ttl,))
+            self.conn.execute(
+                "DELETE FROM generations WHERE key IN ("
+                "SELECT key FROM generations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,))
+
+    def report(self):
+        """Print hit / miss counts and model latency saved by the cache"""
+        print(f"🧠 Generation cache: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+              f"{self.stats['latency_saved']:.1f}s of model latency saved")
+
+
+# Open caches, keyed by database path
+_caches = {}
+
+
+def get_generation_cache(max_entries=DEFAULT_CACHE_MAX_ENTRIES, ttl_hours=DEFAULT_CACHE_TTL_HOURS,
+                         path=GENERATION_CACHE_DB):
+    """Return the shared cache for a database, applying the latest limits"""
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = GenerationCache(path, max_entries=max_entries, ttl_hours=ttl_hours)
+    cache.max_entries = max_entries
+    cache.ttl = ttl_hours * 60 * 60
+    return cache
@@ -0,0 +1,69 @@
+import re
+
+# Words are runs of letters/digits, so "AI" never matches inside "said"
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class KeywordMatcher:
+    """Whole-word, multi-keyword matcher compiled once from the priority keywords
+
+    Keywords are split into word sequences and indexed by their first word,
+    so matching is a single pass over the words of the text with a dict
+    lookup per word, regardless of how many keywords are configured.
+    """
+
+    def __init__(self, keywords, weights=None):
+        """
+        Args:
+            keywords: List of keywords or phrases to look for
+            weights: Optional dict mapping a keyword to its weight (default 1)
+        """
+        weights = {k.lower(): w for k, w in (weights or {}).items()}
+        self.index = {}
+        self.weights = {}
+
+        for keyword in keywords:
+            words = tuple(WORD_PATTERN.findall(keyword.lower()))
+            if not words:
+                continue
+            self.weights[keyword] = weights.get(keyword.lower(), 1)
+            self.index.setdefault(words[0], []).append((words, keyword))
+
+    def match(self, text):
+        """Find the keywords in a text
+
+        Args:
+            text: Text to search (case-insensitive)
+
+        Returns:
+            tuple: (set of matched keywords, weighted score)
+        """
+        words = WORD_PATTERN.findall(text.lower())
+        matched = set()
+
+        for i, word in enumerate(words):
+            for phrase, keyword in self.index.get(word, ()):
+                if keyword in matched:
+                    continue
+                if len(phrase) == 1 or tuple(words[i:i + len(phrase)]) == phrase:
+                    matched.add(keyword)
+
+        score = sum(self.weights[keyword] for keyword in matched)
+        return matched, score
+
+
+# Matchers already compiled, keyed by the keyword config they were built from
+_matchers = {}
+
+
+def get_keyword_matcher(config):
+    """Return the compiled matcher for a config, building it only when the keywords change"""
+    keywords = tuple(config.get("priority_keywords", []))
+    weights = config.get("keyword_weights", {})
+    key = (keywords, tuple(sorted(weights.items())))
+
+    matcher = _matchers.get(key)
+    if matcher is None:
+        _matchers.clear()
+        matcher = _matchers[key] = KeywordMatcher(keywords, weights)
+    return matcher
@@ -1,34 +1,84 @@
-import feedparser
+import time
+STARTED = time.perf_counter()
+
 from datetime import datetime, timedelta
+import calendar
 import pytz
 import os
-import time
+import sys
 import json
 import random
-import google.generativeai as genai
+import re
+import signal
+import argparse
+import importlib
 from dotenv import load_dotenv
-from twitter_bot import post_tweet
+from twitter_bot import post_tweet, close_browser_session, configure_bot
+from feed_cursors import FeedCursors, scoring_fingerprint
+from keyword_matcher import get_keyword_matcher
+from posted_store import get_posted_links_store, DEFAULT_DEDUPE_WINDOW_DAYS
+from tweet_log import append_log_entry
+from tweet_stats import record_tweet, record_posted_links
+from generation_cache import get_generation_cache, generation_key
+from pipeline import Pipeline, DEFAULT_QUEUE_SIZE
+from outbox import get_outbox, FAILED
+from post_scheduler import get_post_scheduler, DEFAULT_MAX_SLOT_WAIT
+from gemini_client import get_gemini_client, configure_gemini
+from candidates import NewsItem, CandidatePool, top_candidates, score_key, DEFAULT_POOL_SIZE, DEFAULT_RESERVE
+
+IMPORTS_DONE = time.perf_counter()
 
 # Load environment variables
 load_dotenv()
 
 # Configure Google Generative AI
+MODEL_NAME = "models/gemini-1.5-flash"
+
+# Bump whenever the prompt template changes so cached generations are not reused
+PROMPT_VERSION = 1
+
+# Generated tweets must not contain links
+LINK_PATTERN = re.compile(r"https?://|www\.", re.IGNORECASE)
+
 API_KEY = os.getenv("API_KEY")
-if API_KEY:
-    genai.configure(api_key=API_KEY)
-    model = genai.GenerativeModel("models/gemini-1.5-flash")
-else:
-    print("⚠️ Warning: API_KEY not found in environment variables")
-    model = None
+
+# Gemini model (wrapped in a GeminiClient), created by get_model() the first time a tweet needs generating
+_model = None
+_model_loaded = False
+
+# Heavy dependencies that are only imported on the code path that needs them,
+# reported by --startup-profile
+LAZY_IMPORTS = [
+    ("Gemini (google.generativeai)", "google.generativeai"),
+    ("Feed download (requests, feedparser)", "feed_fetcher"),
+    ("Selenium", "selenium.webdriver"),
+    ("Twitter API (tweepy)", "tweepy")
+]
 
 # Constants
 POSTED_LINKS_FILE = 'posted_links.txt'
-LOG_FILE = 'tweet_log.json'
 CONFIG_FILE = 'bot_config.json'
 
 # Time zone
 IST = pytz.timezone('Asia/Kolkata')
 
+def get_model():
+    """Return the Gemini model, importing and configuring the client on first use (None without API_KEY)
+    
+    The model is wrapped in a GeminiClient, so every generate_content() call
+    gets a deadline, an optional hedged request and the circuit breaker.
+    """
+    global _model, _model_loaded
+    if not _model_loaded:
+        _model_loaded = True
+        if API_KEY:
+            import google.generativeai as genai
+            genai.configure(api_key=API_KEY)
+            _model = get_gemini_client(genai.GenerativeModel(MODEL_NAME))
+        else:
+            print("⚠️ Warning: API_KEY not found in environment variables")
+    return _model
+
 # Default configuration - can be overridden by config file
 DEFAULT_CONFIG = {
     # RSS Feed sources and their categories
@@ -56,6 +106,9 @@ DEFAULT_CONFIG = {
         "Supreme Court", "BJP"
     ],
     
+    # Optional per-keyword weights; keywords not listed here count as 1
+    "keyword_weights": {},
+    
     # Weighting for different news categories
     "category_weights": {
         "trending": 5,
@@ -74,11 +127,78 @@ DEFAULT_CONFIG = {
     # Maximum news age in days (1 = today only, 2 = today + yesterday)
     "max_news_age": 2,
     
+    # Days a posted article is remembered so it isn't tweeted again
+    "dedupe_window_days": 7,
+    
     # Tweet posting method ('selenium' or 'api')
     "tweet_method": "selenium",
     
-    # Time between tweets in seconds
-    "tweet_delay": 300  # 5 minutes
+    # API posting retries for rate limits and transient errors; Selenium is used only on fatal errors
+    "api_retry": {"max_attempts": 4, "max_wait": 900},
+    
+    # Browser performance profile for Selenium posting ('default' or 'light' = headless,
+    # eager page loads, blocked images/media/fonts) and per-option overrides
+    "browser_profile": "default",
+    "browser_options": {},
+    
+    # Days a saved browser login is reused before logging in again
+    "session_max_age_days": 14,
+    
+    # Per-step upper bounds (seconds) for browser waits, e.g. {"composer": 20}
+    "wait_timeouts": {},
+    
+    # Debug screenshots / DOM snapshots under debug_artifacts/: level is "off", "failure"
+    # (default) or "verbose"; max_files and max_mb cap the directory
+    "debug_capture": {"level": "failure", "max_files": 60, "max_mb": 50},
+    
+    # Minimum time between tweets in seconds, across all runs and posting methods
+    "tweet_delay": 300,  # 5 minutes
+    
+    # Posting caps shared by all runs; burst is how many posts may go out back to back
+    "post_limits": {"max_per_hour": 10, "max_per_day": 50, "burst": 3},
+    
+    # Longest a run waits for a posting slot (seconds); later items stay in the outbox
+    "max_slot_wait": DEFAULT_MAX_SLOT_WAIT,
+    
+    # Failed posts stay in the outbox and are retried by later runs: attempts per tweet
+    # and minutes before the first retry (doubled after each failure)
+    "outbox_max_attempts": 3,
+    "outbox_retry_backoff_minutes": 10,
+    
+    # Maximum number of feeds downloaded at the same time
+    "fetch_concurrency": 6,
+    
+    # Maximum seconds to spend downloading a single feed
+    "feed_timeout": 10,
+    
+    # Maximum seconds for fetching all feeds; slower feeds are skipped for the run
+    "fetch_deadline": 45,
+    
+    # Cached Gemini generations: maximum entries kept and hours before they expire
+    "generation_cache_max_entries": 500,
+    "generation_cache_ttl_hours": 72,
+    
+    # Number of news items packed into one Gemini prompt
+    "generation_batch_size": 5,
+    
+    # Gemini calls: deadline and hedge delay in seconds (hedge_after 0 = no hedging), and the
+    # consecutive failures / cooldown seconds of the circuit breaker that switches to template tweets
+    "gemini_calls": {"timeout": 30, "hedge_after": 10, "failure_threshold": 3, "cooldown": 300},
+    
+    # Items buffered between the generate, post and log stages of a run
+    "pipeline_queue_size": 2,
+    
+    # Seconds a cached feed is reused without contacting the server (0 = always revalidate)
+    "feed_cache_max_age": 0,
+    
+    # Candidates carried over between runs (best by score), and next-best items kept to
+    # replace selected ones that another run queued first
+    "candidate_pool_size": 500,
+    "candidate_reserve": 5,
+    
+    # main.py --daemon: minutes between scheduled runs and the local control port
+    "daemon_interval_minutes": 60,
+    "daemon_port": 8765
 }
 
 def load_config():
@@ -99,121 +219,233 @@ def load_config():
         print(f"⚠️ Error loading configuration: {e}")
         return DEFAULT_CONFIG
 
-def load_posted_links():
-    """Load previously posted links to avoid duplication"""
-    if not os.path.exists(POSTED_LINKS_FILE):
-        return set()
-    
-    today_str = datetime.now(IST).date().isoformat()
-    posted = set()
-    
-    try:
-        with open(POSTED_LINKS_FILE, 'r') as f:
-            lines = f.readlines()
-            
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            try:
-                date, link = line.split('|', 1)
-                # Keep links from today to avoid duplicates
-                if date == today_str:
-                    posted.add(link)
-            except ValueError:
-                # Handle incorrectly formatted lines
-                pass
-                
-        print(f"✅ Loaded {len(posted)} posted links from today")
-        return posted
-        
-    except Exception as e:
-        print(f"⚠️ Error loading posted links: {e}")
-        return set()
+def load_posted_links(window_days=DEFAULT_DEDUPE_WINDOW_DAYS):
+    """Open the posted links store used to avoid duplication"""
+    store = get_posted_links_store(window_days)
+    print(f"✅ Loaded {len(store)} posted links from the last {window_days} days")
+    return store
 
-def save_posted_links(new_links, date=None):
-    """Save links to the posted links file"""
+def save_posted_links(new_links, date=None, window_days=DEFAULT_DEDUPE_WINDOW_DAYS):
+    """Save links to the posted links store"""
     if not new_links:
         return
         
-    if date is None:
+    posted_at = None
+    if date is not None:
+        posted_at = IST.localize(datetime.strptime(date, "%Y-%m-%d")).timestamp()
+    else:
         date = datetime.now(IST).date().isoformat()
         
     try:
+        store = get_posted_links_store(window_days)
+        store.add_many(new_links, posted_at=posted_at)
+        store.flush()
+        
+        # Keep the plain-text history so rebuild_stats() can recount posted links; dedupe no longer reads it
         with open(POSTED_LINKS_FILE, 'a') as f:
             for link in new_links:
                 f.write(f"{date}|{link}\n")
-        print(f"✅ Saved {len(new_links)} new links to posted links file")
+        record_posted_links(len(new_links), date)
+        print(f"✅ Saved {len(new_links)} new links to posted links store")
     except Exception as e:
         print(f"⚠️ Error saving posted links: {e}")
 
 def log_tweet(news_item, tweet_text, success=True):
-    """Log tweet attempts to a file"""
+    """Append a tweet attempt to the tweet log"""
     log_entry = {
         "timestamp": datetime.now(IST).isoformat(),
         "title": news_item.get("title", ""),
         "link": news_item.get("link", ""),
+        "category": news_item.get("category", ""),
         "tweet": tweet_text,
         "success": success
     }
     
     try:
-        # Load existing log
-        log_data = []
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, 'r') as f:
-                log_data = json.load(f)
-        
-        # Add new entry
-        log_data.append(log_entry)
-        
-        # Save updated log
-        with open(LOG_FILE, 'w') as f:
-            json.dump(log_data, f, indent=2)
-            
+        append_log_entry(log_entry)
+        record_tweet(log_entry)
     except Exception as e:
         print(f"⚠️ Error logging tweet: {e}")
 
-def rephrase_for_twitter(title, explanation, category=None):
-    """Create an engaging tweet from news content using AI"""
+def build_prompt(title, explanation, category=None):
+    """Build the Gemini prompt for a news item"""
+    return (
+        f"Rephrase the following news for a Twitter post. Make it engaging, informative and include 2-3 relevant hashtags.\n"
+        f"- Use **bold** for important keywords (Twitter supports markdown)\n"
+        f"- Keep it under 280 characters\n"
+        f"- Don't mention 'article' or 'news summary'\n"
+        f"- Don't include links\n"
+        f"- Category: {category or 'general'}\n\n"
+        f"Title: {title}\n"
+        f"Summary: {explanation}\n\n"
+        f"Twitter Post:"
+    )
+
+def fallback_tweet(title, explanation, category=None):
+    """Template tweet used when the model is unavailable or fails"""
+    hashtags = f" #{category.capitalize()}" if category else ""
+    tweet = f"{title} — {explanation[:100]}...{hashtags} #News"
+    return tweet[:280]  # Ensure we stay under Twitter's character limit
+
+def rephrase_for_twitter(title, explanation, category=None, cache=None, key=None):
+    """Create an engaging tweet from news content using AI
+    
+    Pass key when the caller already looked it up in the cache and missed, so
+    the lookup (and its miss) isn't repeated.
+    """
+    model = get_model()
     if not model:
         # Fallback if API key not available
-        hashtags = f" #{category.capitalize()}" if category else ""
-        return f"{title} — {explanation[:100]}...{hashtags} #News"
+        return fallback_tweet(title, explanation, category)
+    
+    if cache is None:
+        cache = get_generation_cache()
+    
+    # Same article and prompt template always produce a reusable generation
+    if key is None:
+        key = generation_key(PROMPT_VERSION, MODEL_NAME, title, explanation, category)
+        cached = cache.get(key)
+        if cached:
+            return cached
     
     try:
-        prompt = (
-            f"Rephrase the following news for a Twitter post. Make it engaging, informative and include 2-3 relevant hashtags.\n"
-            f"- Use **bold** for important keywords (Twitter supports markdown)\n"
-            f"- Keep it under 280 characters\n"
-            f"- Don't mention 'article' or 'news summary'\n"
-            f"- Don't include links\n"
-            f"- Category: {category or 'general'}\n\n"
-            f"Title: {title}\n"
-            f"Summary: {explanation}\n\n"
-            f"Twitter Post:"
-        )
+        prompt = build_prompt(title, explanation, category)
 
+        started = time.monotonic()
         response = model.generate_content(prompt)
+        latency = time.monotonic() - started
         tweet_text = response.text.strip()
+        if not tweet_text:
+            raise ValueError("model returned an empty response")
         
         # Ensure tweet isn't too long (Twitter limit is 280 chars)
         if len(tweet_text) > 280:
             # Truncate tweet and add ellipsis
             tweet_text = tweet_text[:277] + "..."
-            
+        
+        # Only real generations are cached; fallbacks below are retried next time
+        cache.put(key, tweet_text, latency)
         return tweet_text
         
     except Exception as e:
         print(f"⚠️ Error generating tweet content: {e}")
         # Fallback in case of error
-        hashtags = f" #{category.capitalize()}" if category else ""
-        tweet = f"{title} — {explanation[:100]}...{hashtags} #News"
-        return tweet[:280]  # Ensure we stay under Twitter's character limit
+        return fallback_tweet(title, explanation, category)
+
+def build_batch_prompt(news_items):
+    """Build one Gemini prompt asking for a tweet for each of several news items"""
+    articles = "\n\n".join(
+        f"[{i}] Category: {news.get('category') or 'general'}\n"
+        f"Title: {news['title']}\n"
+        f"Summary: {news['explanation']}"
+        for i, news in enumerate(news_items)
+    )
+    return (
+        f"Rephrase each of the following news items for a Twitter post. Make each one engaging, informative and include 2-3 relevant hashtags.\n"
+        f"- Use **bold** for important keywords (Twitter supports markdown)\n"
+        f"- Keep each post under 280 characters\n"
+        f"- Don't mention 'article' or 'news summary'\n"
+        f"- Don't include links\n\n"
+        f"Respond with only a JSON array of objects like {{\"id\": 0, \"tweet\": \"...\"}}, one per item, using the item numbers below.\n\n"
+        f"{articles}"
+    )
 
-def fetch_and_rank_news(config):
-    """Fetch news from RSS feeds and rank them by importance"""
+def validate_tweet(tweet_text):
+    """Check a generated tweet is usable as-is: non-empty, within the limit and without links"""
+    return (isinstance(tweet_text, str) and tweet_text.strip() != ""
+            and len(tweet_text.strip()) <= 280 and not LINK_PATTERN.search(tweet_text))
+
+def parse_batch_response(text):
+    """Parse a batch response into {item id: tweet}, tolerating code fences around the JSON"""
+    start, end = text.find('['), text.rfind(']')
+    if start == -1 or end < start:
+        raise ValueError("no JSON array in batch response")
+    
+    tweets = {}
+    for item in json.loads(text[start:end + 1]):
+        if isinstance(item, dict) and isinstance(item.get("id"), int):
+            tweets[item["id"]] = item.get("tweet")
+    return tweets
+
+def generate_tweets(news_items, config, cache=None):
+    """Generate tweets for all selected news items before posting starts
+    
+    Cached generations are reused, the rest are requested from Gemini in
+    batched multi-item prompts. Any item whose batch output is missing or
+    fails validation falls back to its own rephrase_for_twitter() call.
+    
+    Args:
+        news_items: List of news item dicts
+        config: Bot configuration
+        cache: GenerationCache to read and fill
+    
+    Returns:
+        list: Tweet texts in the same order as news_items
+    """
+    if cache is None:
+        cache = get_generation_cache()
+    
+    started = time.monotonic()
+    tweets = [None] * len(news_items)
+    model = get_model()
+    
+    # Serve what we can from the cache; only the rest needs the model
+    keys = [generation_key(PROMPT_VERSION, MODEL_NAME, news['title'], news['explanation'], news['category'])
+            for news in news_items]
+    missing = []
+    for i, key in enumerate(keys):
+        if model:
+            tweets[i] = cache.get(key)
+        if tweets[i] is None:
+            missing.append(i)
+    
+    batch_size = max(1, config.get("generation_batch_size", 5))
+    if model and len(missing) > 1:
+        for offset in range(0, len(missing), batch_size):
+            batch = missing[offset:offset + batch_size]
+            try:
+                batch_started = time.monotonic()
+                response = model.generate_content(
+                    build_batch_prompt([news_items[i] for i in batch]),
+                    generation_config={"response_mime_type": "application/json"}
+                )
+                latency = (time.monotonic() - batch_started) / len(batch)
+                results = parse_batch_response(response.text)
+            except Exception as e:
+                print(f"⚠️ Batch generation failed, generating items one by one: {e}")
+                continue
+            
+            for position, i in enumerate(batch):
+                tweet_text = results.get(position)
+                if validate_tweet(tweet_text):
+                    tweets[i] = tweet_text.strip()
+                    cache.put(keys[i], tweets[i], latency)
+                else:
+                    print(f"⚠️ Batch output for item {i + 1} was invalid, regenerating it alone")
+    
+    # Anything the batch didn't produce gets its own call (with template fallback)
+    for i, news in enumerate(news_items):
+        if tweets[i] is None:
+            tweets[i] = rephrase_for_twitter(news['title'], news['explanation'], news['category'],
+                                             cache=cache, key=keys[i])
+    
+    print(f"✍️ Generated {len(tweets)} tweets in {time.monotonic() - started:.1f}s")
+    return tweets
+
+def fetch_and_rank_news(config, exclude_links=(), limit=None):
+    """Fetch news from RSS feeds and rank them by importance
+    
+    Candidates are streamed as compact NewsItem records; only the top
+    limit + reserve (by score) and the carry-over pool are ever held.
+    
+    Args:
+        config: Bot configuration
+        exclude_links: Links never to return, e.g. items already queued in the outbox
+        limit: Number of items needed; None ranks every candidate
+    
+    Returns:
+        list: News item dicts, highest score first
+    """
     now = datetime.now(IST)
     today = now.date()
     
@@ -224,146 +456,339 @@ def fetch_and_rank_news(config):
     # Get category weights from config
     category_weights = config.get("category_weights", {})
     
-    # Get already posted links to avoid duplicates
-    posted_links = load_posted_links()
+    # Get links posted within the dedupe window to avoid duplicates
+    posted_links = load_posted_links(config.get("dedupe_window_days", DEFAULT_DEDUPE_WINDOW_DAYS))
+    
+    # Set to track seen links to avoid duplicates across feeds (and skip excluded ones)
+    seen_links = set(exclude_links)
+    
+    # Keyword matcher is compiled once per keyword config
+    keyword_matcher = get_keyword_matcher(config)
+    
+    # Per-feed cursors let us skip entries that earlier runs already processed
+    cursors = FeedCursors(scoring_fingerprint(config))
+    
+    # Fetch all RSS feeds concurrently; results come back in config order
+    # Unchanged feeds are answered from the on-disk cache via conditional GETs
+    feed_configs = config.get("rss_feeds", [])
+    # Imported here so runs that never fetch don't pay for requests / feedparser
+    from feed_fetcher import fetch_feeds
+    from feed_cache import get_feed_cache
     
-    # Set to track seen links to avoid duplicates across feeds
-    seen_links = set()
+    feed_cache = get_feed_cache(max_age=config.get("feed_cache_max_age", 0))
+    feeds = fetch_feeds(
+        feed_configs,
+        concurrency=config.get("fetch_concurrency", 6),
+        feed_timeout=config.get("feed_timeout", 10),
+        deadline=config.get("fetch_deadline", 45),
+        cache=feed_cache
+    )
+    feed_cache.save()
+    feed_cache.report()
     
-    # List to store all news items
-    all_news = []
+    new_entries = 0
     
-    # Fetch news from each RSS feed
-    for feed_config in config.get("rss_feeds", []):
-        feed_url = feed_config.get("url")
-        category = feed_config.get("category", "general")
+    def candidates():
+        """Yield every surviving candidate, pool first, then feeds in config order"""
+        nonlocal new_entries
         
-        try:
-            print(f"📰 Fetching feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
+        # Reuse candidates scored by earlier runs that are still fresh and unposted
+        for record in cursors.pool:
+            if record['pub_date'] < oldest_date.isoformat():
+                continue
+            if record['link'] in seen_links or record['link'] in posted_links:
+                continue
+            
+            # Add random factor to avoid always picking the same feeds
+            seen_links.add(record['link'])
+            yield NewsItem.from_record(record, record['base_score'] + random.uniform(0, 0.5))
+        
+        # Process feeds in config order so dedupe matches the sequential path
+        for feed_config, feed in zip(feed_configs, feeds):
+            if feed is None:
+                continue
+                
+            feed_url = feed_config.get("url")
+            category = feed_config.get("category", "general")
+            feed_guids = set()
+            newest = 0
             
-            for entry in feed.entries:
-                # Get publication date
-                pub_date = None
-                if hasattr(entry, 'published_parsed'):
+            try:
+                for entry in feed.entries:
+                    # Get publication date
+                    pub_date = None
+                    if hasattr(entry, 'published_parsed'):
+                        pub_ts = calendar.timegm(entry.published_parsed)
+                    else:
+                        # Skip entries without a date
+                        continue
+                    
+                    # Skip entries at or below this feed's cursor before doing any work
+                    guid = entry.get('id') or entry.get('link')
+                    feed_guids.add(guid)
+                    newest = max(newest, pub_ts)
+                    if not cursors.is_new(feed_url, guid, pub_ts):
+                        continue
+                    new_entries += 1
+                    
                     pub_date = datetime(*entry.published_parsed[:6]).astimezone(IST).date()
-                else:
-                    # Skip entries without a date
-                    continue
-
-                # Skip old entries
-                if pub_date < oldest_date:
-                    continue
-
-                # Get link and check for duplicates
-                link = getattr(entry, 'link', None)
-                if not link or link in seen_links or link in posted_links:
-                    continue
 
-                # Get title and summary
-                title = getattr(entry, 'title', '').strip()
-                summary = getattr(entry, 'summary', '').strip().replace('\n', ' ')
-                
-                # Use first couple sentences for explanation
-                explanation = '. '.join(summary.split('. ')[:2]) + '.' if summary else 'More details in the article.'
+                    # Skip old entries
+                    if pub_date < oldest_date:
+                        continue
 
-                # Score the news item based on keywords and category
-                combined_text = (title + ' ' + summary).lower()
-                keyword_score = sum(1 for kw in [k.lower() for k in config.get("priority_keywords", [])] 
-                                   if kw in combined_text)
-                
-                # Get category weight (default to 1 if not specified)
-                genre_score = category_weights.get(category, 1)
-                
-                # Calculate total score with keyword score weighted higher
-                total_score = keyword_score * 2 + genre_score
-                
-                # Add random factor to avoid always picking the same feeds
-                randomness = random.uniform(0, 0.5)
-                total_score += randomness
+                    # Get link and check for duplicates
+                    link = getattr(entry, 'link', None)
+                    if not link or link in seen_links or link in posted_links:
+                        continue
 
-                # Add news item to list
-                all_news.append({
-                    'title': title,
-                    'explanation': explanation,
-                    'link': link,
-                    'score': total_score,
-                    'category': category,
-                    'pub_date': pub_date.isoformat()
-                })
+                    # Get title and summary
+                    title = getattr(entry, 'title', '').strip()
+                    summary = getattr(entry, 'summary', '').strip().replace('\n', ' ')
+                    
+                    # Use first couple sentences for explanation
+                    explanation = '. '.join(summary.split('. ')[:2]) + '.' if summary else 'More details in the article.'
 
-                # Mark link as seen
-                seen_links.add(link)
+                    # Score the news item based on whole-word keyword matches and category
+                    _, keyword_score = keyword_matcher.match(title + ' ' + summary)
+                    
+                    # Get category weight (default to 1 if not specified)
+                    genre_score = category_weights.get(category, 1)
+                    
+                    # Calculate total score with keyword score weighted higher
+                    base_score = keyword_score * 2 + genre_score
+                    
+                    # Add random factor to avoid always picking the same feeds
+                    total_score = base_score + random.uniform(0, 0.5)
 
-        except Exception as e:
-            print(f"⚠️ Error parsing feed {feed_url}: {e}")
+                    # Mark link as seen
+                    seen_links.add(link)
+                    yield NewsItem(title, explanation, link, total_score, base_score, category, pub_date.isoformat())
+                
+                cursors.advance(feed_url, feed_guids, newest)
 
-    # Rank news by score
-    ranked_news = sorted(all_news, key=lambda x: x['score'], reverse=True)
+            except Exception as e:
+                print(f"⚠️ Error parsing feed {feed_url}: {e}")
     
-    print(f"✅ Found {len(ranked_news)} news items")
-    return ranked_news
-
-def main():
-    """Main function to run the news bot"""
-    print("🤖 Starting Indian Express Twitter Bot...")
+    # One pass over the stream fills both the carry-over pool and the top-k heap
+    pool = CandidatePool(config.get("candidate_pool_size", DEFAULT_POOL_SIZE))
+    stream = pool.collect(candidates())
+    if limit is None:
+        ranked_news = sorted(stream, key=score_key, reverse=True)
+    else:
+        ranked_news = top_candidates(stream, limit + config.get("candidate_reserve", DEFAULT_RESERVE))
     
-    # Load configuration
-    config = load_config()
+    # Carry the best candidates forward so the next run only scores new entries
+    cursors.save(pool.records())
+    print(f"✅ Processed {new_entries} new feed entries")
     
-    # Fetch and rank news
-    ranked_news = fetch_and_rank_news(config)
+    print(f"✅ Found {pool.count} news items")
+    return [news.as_dict() for news in ranked_news]
+
+def run_bot(config):
+    """Run one cycle: fetch and rank news, generate tweets and post them
     
-    # Select top news based on config
+    The browser session is left open so a long-running process can reuse it;
+    callers that exit afterwards should call close_browser_session().
+    """
+    configure_bot(config)
+    configure_gemini(config.get("gemini_calls", {}))
     tweets_per_run = config.get("tweets_per_run", 3)
-    selected_news = ranked_news[:tweets_per_run]
+    window_days = config.get("dedupe_window_days", DEFAULT_DEDUPE_WINDOW_DAYS)
+    outbox = get_outbox(
+        max_attempts=config.get("outbox_max_attempts", 3),
+        retry_backoff=config.get("outbox_retry_backoff_minutes", 10) * 60
+    )
+    
+    # Tweets left over from failed or interrupted runs go first, with no fetch or generation
+    items = outbox.due(tweets_per_run)
+    if items:
+        print(f"📬 Resuming {len(items)} pending tweets from the outbox")
     
-    if not selected_news:
+    # Fill the rest of the run with fresh news, skipping anything already in the outbox
+    # The next-best candidates are kept in reserve for items another run queues first
+    remaining = tweets_per_run - len(items)
+    reserve = []
+    if remaining > 0:
+        ranked_news = fetch_and_rank_news(config, exclude_links=outbox.links(), limit=remaining)
+        selected_news, reserve = ranked_news[:remaining], ranked_news[remaining:]
+        if selected_news:
+            print(f"📊 Selected {len(selected_news)} news items to tweet")
+        items += [(None, news, None) for news in selected_news]
+    
+    if not items:
         print("❌ No news items found to tweet")
         return
     
-    print(f"📊 Selected {len(selected_news)} news items to tweet")
+    # Generate, post and log in overlapping stages
+    tweet_method = config.get("tweet_method", "selenium")
+    generation_cache = get_generation_cache(
+        max_entries=config.get("generation_cache_max_entries", 500),
+        ttl_hours=config.get("generation_cache_ttl_hours", 72)
+    )
     
-    # Save links that we're about to tweet
-    links_to_save = [news['link'] for news in selected_news]
-    save_posted_links(links_to_save)
+    # Posting slots (spacing, hourly / daily caps) are shared with every other run
+    scheduler = get_post_scheduler(config)
+    max_slot_wait = config.get("max_slot_wait", DEFAULT_MAX_SLOT_WAIT)
     
-    # Post tweets
-    tweet_delay = config.get("tweet_delay", 300)  # 5 minutes by default
-    tweet_method = config.get("tweet_method", "selenium")
+    total = len(items)
+    posted_count = 0
     
-    for i, news in enumerate(selected_news, start=1):
-        try:
-            # Generate tweet content
-            tweet = rephrase_for_twitter(news['title'], news['explanation'], news['category'])
-                
-            print(f"\n📰 News {i}/{len(selected_news)}:")
-            print(f"🔗 Link: {news['link']}")
-            print(f"📝 Tweet: {tweet}")
+    def generate_stage(batch):
+        # Batches whatever items are already queued, so later items generate while earlier ones wait to post
+        fresh = [news for _, news, tweet in batch if tweet is None]
+        generated = iter(generate_tweets(fresh, config, cache=generation_cache) if fresh else [])
+        results = []
+        for item_id, news, tweet in batch:
+            if tweet is None:
+                # Stored before posting so a crash or failure doesn't lose the generation
+                tweet = next(generated)
+                item_id = outbox.add(news, tweet)
+                while item_id is None and reserve:
+                    print(f"⚠️ Already queued by another run, replacing with a reserve item: {news['link']}")
+                    news = reserve.pop(0)
+                    tweet = generate_tweets([news], config, cache=generation_cache)[0]
+                    item_id = outbox.add(news, tweet)
+                if item_id is None:
+                    print(f"⚠️ Already queued by another run, skipping: {news['link']}")
+                    continue
+            results.append((item_id, news, tweet))
+        return results
+    
+    def post_stage(batch):
+        nonlocal posted_count
+        results = []
+        for item_id, news, tweet in batch:
+            posted_count += 1
+            i = posted_count
             
-            # Post tweet
-            success = post_tweet(tweet, method=tweet_method)
+            # Wait for a posting slot only up to max_slot_wait; later slots are left to later runs
+            ticket = scheduler.try_acquire()
+            while ticket is None:
+                wait = scheduler.next_available_slot() - time.time()
+                if wait > max_slot_wait:
+                    print(f"⏭️ Next posting slot is in {wait / 60:.0f} minutes, leaving tweet {i}/{total} in the outbox")
+                    break
+                if wait > 0:
+                    print(f"⏱️ Waiting {wait:.0f} seconds for the next posting slot...")
+                    time.sleep(wait)
+                ticket = scheduler.try_acquire()
+            if ticket is None:
+                continue
             
-            # Log tweet attempt
-            log_tweet(news, tweet, success=success)
+            if not outbox.claim(item_id):
+                scheduler.release(ticket)
+                print(f"⚠️ Tweet {i}/{total} is being posted by another run, skipping")
+                continue
+            
+            try:
+                print(f"\n📰 News {i}/{total}:")
+                print(f"🔗 Link: {news['link']}")
+                print(f"📝 Tweet: {tweet}")
+                
+                # Post tweet, keeping the claim fresh however long retries take
+                with outbox.heartbeat(item_id):
+                    success = post_tweet(tweet, method=tweet_method)
+                error = None if success else "post_tweet reported failure"
+                results.append((news, tweet, success))
+            except Exception as e:
+                print(f"❌ Error posting tweet {i}/{total}: {e}")
+                success, error = False, str(e)
+                results.append((news, "ERROR", False))
             
             if success:
-                print(f"✅ Tweet {i}/{len(selected_news)} posted successfully")
-            else:
-                print(f"❌ Failed to post tweet {i}/{len(selected_news)}")
+                # Only a confirmed post marks the article as posted
+                outbox.mark_posted(item_id)
+                save_posted_links([news['link']], window_days=window_days)
+                print(f"✅ Tweet {i}/{total} posted successfully")
+                continue
             
-            # Wait between tweets if there are more to post
-            if i < len(selected_news):
-                print(f"⏱️ Waiting {tweet_delay} seconds before next tweet...")
-                time.sleep(tweet_delay)
-                
-        except Exception as e:
-            print(f"❌ Error posting tweet {i}/{len(selected_news)}: {e}")
-            log_tweet(news, "ERROR", success=False)
-
+            # Nothing went out, so the slot doesn't count against the limits
+            scheduler.release(ticket)
+            if outbox.mark_failed(item_id, error) == FAILED:
+                print(f"❌ Failed to post tweet {i}/{total}, giving up after {outbox.max_attempts} attempts")
+            else:
+                print(f"❌ Failed to post tweet {i}/{total}, will retry in a later run")
+        return results
+    
+    def log_stage(batch):
+        # Log tweet attempts off the posting thread
+        for news, tweet, success in batch:
+            log_tweet(news, tweet, success=success)
+        return []
+    
+    pipeline = Pipeline(queue_size=config.get("pipeline_queue_size", DEFAULT_QUEUE_SIZE))
+    pipeline.add_stage("generate", generate_stage, batch_size=config.get("generation_batch_size", 5))
+    pipeline.add_stage("post", post_stage)
+    pipeline.add_stage("log", log_stage)
+    pipeline.run(items)
+    
+    outbox.report()
+    generation_cache.report()
+    if _model is not None:
+        _model.report()
     print("\n✅ Twitter bot run completed")
 
+def main():
+    """Main function to run the news bot"""
+    print("🤖 Starting Indian Express Twitter Bot...")
+    
+    # Load configuration
+    config = load_config()
+    
+    try:
+        run_bot(config)
+    finally:
+        # All posts in this run went through one browser session
+        close_browser_session()
+
+def run_daemon():
+    """Keep the bot running, with runs on a timer and on request from the control endpoint"""
+    from bot_daemon import BotDaemon
+    
+    print("🤖 Starting Indian Express Twitter Bot daemon...")
+    daemon = BotDaemon(CONFIG_FILE, load_config, run_bot)
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping daemon")
+    finally:
+        close_browser_session()
+
+def print_startup_profile():
+    """Print how long main.py's imports took and what each lazily imported dependency adds"""
+    total = IMPORTS_DONE - STARTED
+    print("⏱️ Startup profile")
+    print(f"   main.py imports: {total * 1000:.0f} ms")
+    for label, module in LAZY_IMPORTS:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(module)
+            note = ""
+        except ImportError as e:
+            note = f" (not installed: {e.name})"
+        elapsed = time.perf_counter() - started
+        total += elapsed
+        print(f"   {label}: {elapsed * 1000:.0f} ms{note}")
+    print(f"   Total if every path is used: {total * 1000:.0f} ms")
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Indian Express Twitter Bot")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print an import-time breakdown and exit")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running, posting on a timer and when triggered over HTTP")
+    args = parser.parse_args()
+    
+    if args.startup_profile:
+        print_startup_profile()
+        sys.exit(0)
+    
+    if args.daemon:
+        run_daemon()
+        sys.exit(0)
+    
     try:
         main()
     except Exception as e:
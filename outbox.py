@@ -0,0 +1,193 @@
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# SQLite database of generated tweets waiting to be (or already) posted
+OUTBOX_DB = 'outbox.db'
+
+# Item states: pending -> posting -> posted, or back to pending with a backoff
+# until max_attempts is reached, then failed
+PENDING = "pending"
+POSTING = "posting"
+POSTED = "posted"
+FAILED = "failed"
+
+# Defaults used when the config doesn't specify outbox settings
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 10 * 60     # seconds before the first retry, doubled after each failure
+
+# A posting item's updated_at is refreshed this often while its post is in progress
+HEARTBEAT_SECONDS = 60
+
+# An item left in "posting" this long without a heartbeat belongs to a run that died mid-post
+STALE_POSTING_SECONDS = 15 * 60
+
+# Posted / failed items are kept this long so their links stay out of new runs
+RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+
+class Outbox:
+    """Durable queue of generated tweets with per-item state, attempts and retry backoff
+
+    Every generated tweet is stored before posting, so a crashed, killed or
+    failed run leaves its items here and the next run posts them without
+    fetching feeds or calling the model again. claim() moves an item to
+    "posting" atomically, so overlapping runs never post the same item, and
+    heartbeat() keeps it there for as long as its post takes (API retries can
+    wait out several rate-limit windows).
+    """
+
+    def __init__(self, path=OUTBOX_DB, max_attempts=DEFAULT_MAX_ATTEMPTS, retry_backoff=DEFAULT_RETRY_BACKOFF):
+        """
+        Args:
+            path: SQLite database file
+            max_attempts: Posting attempts before an item is marked failed
+            retry_backoff: Seconds before the first retry; doubled after each failure
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                link TEXT NOT NULL UNIQUE,
+                news TEXT NOT NULL,
+                tweet TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                last_error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_outbox_state ON outbox (state, next_attempt_at);
+        """)
+        self.recover()
+
+    def recover(self):
+        """Return items stuck in "posting" by a dead run to pending and drop old finished items"""
+        now = time.time()
+        with self.lock, self.conn:
+            recovered = self.conn.execute(
+                "UPDATE outbox SET state = ?, updated_at = ? WHERE state = ? AND updated_at < ?",
+                (PENDING, now, POSTING, now - STALE_POSTING_SECONDS)).rowcount
+            self.conn.execute(
+                "DELETE FROM outbox WHERE state IN (?, ?) AND updated_at < ?",
+                (POSTED, FAILED, now - RETENTION_SECONDS))
+        if recovered:
+            print(f"♻️ Recovered {recovered} outbox items from an interrupted run")
+
+    def add(self, news, tweet):
+        """Store a generated tweet as pending and return its item id (None if its link is already queued)"""
+        now = time.time()
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO outbox (link, news, tweet, state, next_attempt_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (news['link'], json.dumps(news, ensure_ascii=False), tweet, PENDING, now, now, now))
+            return cursor.lastrowid if cursor.rowcount else None
+
+    def due(self, limit):
+        """Pending items whose backoff has expired, oldest first
+
+        Returns:
+            list: (item id, news dict, tweet text) tuples
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT id, news, tweet FROM outbox WHERE state = ? AND next_attempt_at <= ? "
+                "ORDER BY created_at LIMIT ?", (PENDING, time.time(), limit)).fetchall()
+        return [(item_id, json.loads(news), tweet) for item_id, news, tweet in rows]
+
+    def links(self):
+        """Links of every item in the outbox, so new runs don't select them again"""
+        with self.lock:
+            return {row[0] for row in self.conn.execute("SELECT link FROM outbox")}
+
+    def claim(self, item_id):
+        """Move a pending item to "posting"; False if another run got it first"""
+        now = time.time()
+        with self.lock, self.conn:
+            return self.conn.execute(
+                "UPDATE outbox SET state = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ? AND state = ?", (POSTING, now, item_id, PENDING)).rowcount == 1
+
+    def touch(self, item_id):
+        """Refresh a posting item's updated_at so other runs don't recover it as stale"""
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE outbox SET updated_at = ? WHERE id = ? AND state = ?",
+                              (time.time(), item_id, POSTING))
+
+    @contextmanager
+    def heartbeat(self, item_id, interval=HEARTBEAT_SECONDS):
+        """Touch a claimed item every interval seconds until the block exits"""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(interval):
+                try:
+                    self.touch(item_id)
+                except Exception as e:
+                    print(f"⚠️ Outbox heartbeat failed: {e}")
+
+        thread = threading.Thread(target=beat, name=f"outbox-heartbeat-{item_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def mark_posted(self, item_id):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE outbox SET state = ?, updated_at = ?, last_error = NULL WHERE id = ?",
+                              (POSTED, time.time(), item_id))
+
+    def mark_failed(self, item_id, error=None):
+        """Schedule a retry with exponential backoff, or mark the item failed after max_attempts
+
+        Returns:
+            str: The item's new state
+        """
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT attempts FROM outbox WHERE id = ?", (item_id,)).fetchone()
+            attempts = row[0] if row else self.max_attempts
+            if attempts >= self.max_attempts:
+                state, next_attempt_at = FAILED, now
+            else:
+                state, next_attempt_at = PENDING, now + self.retry_backoff * 2 ** (attempts - 1)
+            self.conn.execute(
+                "UPDATE outbox SET state = ?, next_attempt_at = ?, updated_at = ?, last_error = ? WHERE id = ?",
+                (state, next_attempt_at, now, error, item_id))
+        return state
+
+    def counts(self):
+        """Number of items in each state"""
+        with self.lock:
+            return dict(self.conn.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state").fetchall())
+
+    def report(self):
+        counts = self.counts()
+        print(f"📬 Outbox: {counts.get(PENDING, 0)} pending, {counts.get(POSTING, 0)} posting, "
+              f"{counts.get(POSTED, 0)} posted, {counts.get(FAILED, 0)} failed")
+
+
+# Open outboxes, keyed by database path
+_outboxes = {}
+
+
+def get_outbox(max_attempts=DEFAULT_MAX_ATTEMPTS, retry_backoff=DEFAULT_RETRY_BACKOFF, path=OUTBOX_DB):
+    """Return the shared outbox for a database, applying the latest retry settings"""
+    outbox = _outboxes.get(path)
+    if outbox is None:
+        outbox = _outboxes[path] = Outbox(path, max_attempts=max_attempts, retry_backoff=retry_backoff)
+    else:
+        outbox.recover()
+    outbox.max_attempts = max_attempts
+    outbox.retry_backoff = retry_backoff
+    return outbox
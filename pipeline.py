@@ -0,0 +1,141 @@
+import queue
+import threading
+import time
+
+# Bounded queue size between stages when the config doesn't specify one
+DEFAULT_QUEUE_SIZE = 2
+
+# Marks the end of a stage's input
+DONE = object()
+
+
+class Stage:
+    """One pipeline stage: a worker thread draining a bounded input queue
+
+    The handler receives a list of up to batch_size items (whatever is already
+    queued, never waiting for a batch to fill) and returns a list of outputs
+    for the next stage. Time is split into busy (in the handler), idle
+    (waiting for input) and blocked (waiting for room downstream).
+    """
+
+    def __init__(self, name, handler, batch_size=1, queue_size=DEFAULT_QUEUE_SIZE):
+        self.name = name
+        self.handler = handler
+        self.batch_size = max(1, batch_size)
+        self.input = queue.Queue(maxsize=queue_size)
+        self.output = None
+        self.thread = None
+        self.stats = {"items": 0, "busy": 0.0, "idle": 0.0, "blocked": 0.0, "max_depth": 0}
+
+    def put(self, item):
+        self.input.put(item)
+        self.stats["max_depth"] = max(self.stats["max_depth"], self.input.qsize())
+
+    def next_batch(self):
+        """Block for one item, then take whatever else is queued up to batch_size
+
+        Returns:
+            tuple: (items, done) - done is True once the end of input was seen
+        """
+        started = time.monotonic()
+        item = self.input.get()
+        self.stats["idle"] += time.monotonic() - started
+        if item is DONE:
+            return [], True
+
+        batch = [item]
+        while len(batch) < self.batch_size:
+            try:
+                item = self.input.get_nowait()
+            except queue.Empty:
+                break
+            if item is DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def forward(self, item):
+        if self.output is None:
+            return
+        started = time.monotonic()
+        self.output.put(item)
+        self.stats["blocked"] += time.monotonic() - started
+
+    def work(self):
+        done = False
+        while not done:
+            batch, done = self.next_batch()
+            if not batch:
+                continue
+            started = time.monotonic()
+            try:
+                results = self.handler(batch)
+            except Exception as e:
+                print(f"❌ Pipeline stage '{self.name}' failed on {len(batch)} item(s): {e}")
+                results = []
+            self.stats["busy"] += time.monotonic() - started
+            self.stats["items"] += len(batch)
+            for result in results:
+                self.forward(result)
+        self.forward(DONE)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.work, name=f"pipeline-{self.name}", daemon=True)
+        self.thread.start()
+
+    def report(self):
+        stats = self.stats
+        print(f"   {self.name}: {stats['items']} items, busy {stats['busy']:.1f}s, "
+              f"idle {stats['idle']:.1f}s, blocked {stats['blocked']:.1f}s, "
+              f"max queue depth {stats['max_depth']}")
+
+
+class Pipeline:
+    """Stages connected by bounded queues, each running on its own thread
+
+    Items flow through in order; a slow stage (e.g. posting, which waits for
+    its slot) lets earlier stages work ahead only as far as the queues allow.
+    """
+
+    def __init__(self, queue_size=DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.stages = []
+
+    def add_stage(self, name, handler, batch_size=1):
+        # A batching stage needs room to see a whole batch in its queue
+        stage = Stage(name, handler, batch_size=batch_size, queue_size=max(self.queue_size, batch_size))
+        if self.stages:
+            self.stages[-1].output = stage
+        self.stages.append(stage)
+        return self
+
+    def run(self, items):
+        """Feed items through every stage and wait until the last one finishes"""
+        started = time.monotonic()
+        for stage in self.stages[1:]:
+            stage.start()
+
+        # Queue what fits before the first stage starts so its first batch isn't a lone item
+        first = self.stages[0]
+        items = iter(items)
+        pending = None
+        for item in items:
+            if first.input.full():
+                pending = item
+                break
+            first.put(item)
+        first.start()
+        if pending is not None:
+            first.put(pending)
+        for item in items:
+            first.put(item)
+        first.put(DONE)
+
+        for stage in self.stages:
+            stage.thread.join()
+        self.report(time.monotonic() - started)
+
+    def report(self, elapsed):
+        print(f"🧵 Pipeline finished in {elapsed:.1f}s")
+        for stage in self.stages:
+            stage.report()
@@ -0,0 +1,133 @@
+import os
+import json
+import time
+from file_lock import file_lock
+
+# Posting history and token bucket shared by every run and posting method
+POST_SCHEDULE_FILE = 'post_schedule.json'
+
+# Defaults used when the config doesn't specify posting limits
+DEFAULT_MIN_SPACING = 300
+DEFAULT_MAX_PER_HOUR = 10
+DEFAULT_MAX_PER_DAY = 50
+DEFAULT_BURST = 3
+
+# Longest a run waits for a posting slot when the config doesn't say (seconds)
+DEFAULT_MAX_SLOT_WAIT = 300
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+
+class PostScheduler:
+    """Cross-process posting rate limiter backed by a file on disk
+
+    A post needs a token from a bucket holding up to `burst` tokens and
+    refilling at max_per_hour per hour, must come at least min_spacing
+    seconds after the previous post, and may not exceed the hourly and daily
+    caps. State is read and written under a file lock, so overlapping runs
+    (cron plus a manual run, API plus Selenium) share one budget.
+    """
+
+    def __init__(self, path=POST_SCHEDULE_FILE, min_spacing=DEFAULT_MIN_SPACING,
+                 max_per_hour=DEFAULT_MAX_PER_HOUR, max_per_day=DEFAULT_MAX_PER_DAY, burst=DEFAULT_BURST):
+        """
+        Args:
+            path: JSON file holding the shared state
+            min_spacing: Minimum seconds between two posts
+            max_per_hour: Posts allowed in any rolling hour (also the bucket refill rate)
+            max_per_day: Posts allowed in any rolling 24 hours
+            burst: Bucket capacity, i.e. posts allowed back to back after a quiet period
+        """
+        self.path = path
+        self.lock_path = path + '.lock'
+        self.min_spacing = min_spacing
+        self.max_per_hour = max_per_hour
+        self.max_per_day = max_per_day
+        self.burst = burst
+        self.rate = max_per_hour / HOUR
+
+    def load(self, now):
+        """Read the state and bring the bucket and history up to date (call under the lock)"""
+        state = None
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    state = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Error loading post schedule: {e}")
+        if state is None:
+            state = {"tokens": self.burst, "updated_at": now, "last_post_at": 0, "posts": []}
+
+        elapsed = max(0, now - state["updated_at"])
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * self.rate)
+        state["updated_at"] = now
+        state["posts"] = sorted(t for t in state["posts"] if t > now - DAY)
+        return state
+
+    def save(self, state):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def slot(self, state, now):
+        """Earliest time a post is allowed given the state"""
+        candidates = [now, state["last_post_at"] + self.min_spacing]
+        if state["tokens"] < 1:
+            candidates.append(now + (1 - state["tokens"]) / self.rate)
+
+        for window, cap in ((HOUR, self.max_per_hour), (DAY, self.max_per_day)):
+            recent = [t for t in state["posts"] if t > now - window]
+            if len(recent) >= cap:
+                # Wait until enough of the window's posts have aged out
+                candidates.append(recent[len(recent) - cap] + window)
+        return max(candidates)
+
+    def next_available_slot(self):
+        """Unix time of the earliest allowed post (now or earlier means a post is allowed)"""
+        now = time.time()
+        with file_lock(self.lock_path):
+            return self.slot(self.load(now), now)
+
+    def try_acquire(self):
+        """Take a posting slot if one is available now, without blocking
+
+        Returns:
+            dict: Ticket to pass to release() if the post doesn't happen, or
+            None if no slot is available (see next_available_slot())
+        """
+        now = time.time()
+        with file_lock(self.lock_path):
+            state = self.load(now)
+            if self.slot(state, now) > now:
+                return None
+            ticket = {"at": now, "previous_last_post_at": state["last_post_at"]}
+            state["tokens"] -= 1
+            state["posts"].append(now)
+            state["last_post_at"] = now
+            self.save(state)
+            return ticket
+
+    def release(self, ticket):
+        """Give a slot back when its post failed, so it doesn't count against the limits"""
+        now = time.time()
+        with file_lock(self.lock_path):
+            state = self.load(now)
+            state["tokens"] = min(self.burst, state["tokens"] + 1)
+            if ticket["at"] in state["posts"]:
+                state["posts"].remove(ticket["at"])
+            if state["last_post_at"] == ticket["at"]:
+                state["last_post_at"] = ticket["previous_last_post_at"]
+            self.save(state)
+
+
+def get_post_scheduler(config):
+    """Build the scheduler from the bot config; spacing comes from tweet_delay"""
+    limits = config.get("post_limits", {})
+    return PostScheduler(
+        min_spacing=config.get("tweet_delay", DEFAULT_MIN_SPACING),
+        max_per_hour=limits.get("max_per_hour", DEFAULT_MAX_PER_HOUR),
+        max_per_day=limits.get("max_per_day", DEFAULT_MAX_PER_DAY),
+        burst=limits.get("burst", DEFAULT_BURST)
+    )
@@ -0,0 +1,194 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+import pytz
+
+# SQLite database holding recently posted links
+POSTED_LINKS_DB = 'posted_links.db'
+
+# Legacy "date|link" text file, imported into the database once
+LEGACY_POSTED_LINKS_FILE = 'posted_links.txt'
+
+# How long a posted link blocks the same article from being tweeted again
+DEFAULT_DEDUPE_WINDOW_DAYS = 7
+
+# Compact at most this often (seconds)
+COMPACT_INTERVAL = 24 * 60 * 60
+
+IST = pytz.timezone('Asia/Kolkata')
+
+
+def link_hash(link):
+    """Stable hash used as the primary key for a link"""
+    return hashlib.sha1(link.encode("utf-8")).hexdigest()
+
+
+class PostedLinksStore:
+    """Indexed store of posted links with a configurable dedupe window
+
+    Membership checks hit an in-memory map of link hash -> posted_at for the
+    window, loaded with one indexed query when the store is opened and again
+    by refresh(), so a long-lived process sees links posted by other runs.
+    Links are checked against the window at lookup time, so it keeps sliding
+    between refreshes. New links are buffered and written in a single
+    transaction by flush().
+    """
+
+    def __init__(self, path=POSTED_LINKS_DB, window_days=DEFAULT_DEDUPE_WINDOW_DAYS,
+                 legacy_file=LEGACY_POSTED_LINKS_FILE):
+        """
+        Args:
+            path: SQLite database file
+            window_days: Days a posted link is remembered for dedupe
+            legacy_file: Old posted_links.txt to import on first use
+        """
+        self.path = path
+        self.window_days = window_days
+        self.lock = threading.Lock()
+        self.pending = []
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS posted_links (
+                link_hash TEXT PRIMARY KEY,
+                link TEXT NOT NULL,
+                posted_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posted_links_posted_at ON posted_links (posted_at);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+        if legacy_file:
+            self.import_legacy_file(legacy_file)
+        self.compact()
+        self.posted = self.load_window()
+
+    def window_start(self):
+        """Oldest posted_at timestamp still inside the dedupe window"""
+        return time.time() - self.window_days * 24 * 60 * 60
+
+    def get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def import_legacy_file(self, legacy_file):
+        """Import posted_links.txt into the database the first time the store is opened
+
+        The store is marked imported even when there is no file, since
+        save_posted_links() keeps appending to it afterwards.
+        """
+        if self.get_meta("legacy_imported"):
+            return
+        if not os.path.exists(legacy_file):
+            with self.conn:
+                self.set_meta("legacy_imported", time.time())
+            return
+
+        rows = []
+        try:
+            with open(legacy_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        date, link = line.split('|', 1)
+                        day = IST.localize(datetime.strptime(date, "%Y-%m-%d"))
+                        rows.append((link_hash(link), link, day.timestamp()))
+                    except ValueError:
+                        # Handle incorrectly formatted lines
+                        pass
+        except Exception as e:
+            print(f"⚠️ Error importing posted links file: {e}")
+            return
+
+        # Never overwrite a real posted_at with the file's day-only date
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO posted_links (link_hash, link, posted_at) VALUES (?, ?, ?)", rows)
+            self.set_meta("legacy_imported", time.time())
+        print(f"✅ Imported {len(rows)} links from {legacy_file}")
+
+    def compact(self):
+        """Delete links that have fallen out of the dedupe window, at most once a day"""
+        last_compacted = float(self.get_meta("last_compacted") or 0)
+        if time.time() - last_compacted < COMPACT_INTERVAL:
+            return
+
+        with self.conn:
+            deleted = self.conn.execute(
+                "DELETE FROM posted_links WHERE posted_at < ?", (self.window_start(),)).rowcount
+            self.set_meta("last_compacted", time.time())
+        if deleted:
+            print(f"🧹 Compacted {deleted} expired posted links")
+
+    def load_window(self):
+        """Load hash -> posted_at for all links posted inside the dedupe window"""
+        rows = self.conn.execute(
+            "SELECT link_hash, posted_at FROM posted_links WHERE posted_at >= ?", (self.window_start(),))
+        return dict(rows.fetchall())
+
+    def refresh(self):
+        """Write buffered links, compact if due and reload the window from the database"""
+        self.flush()
+        self.compact()
+        posted = self.load_window()
+        with self.lock:
+            self.posted = posted
+
+    def __contains__(self, link):
+        posted_at = self.posted.get(link_hash(link))
+        return posted_at is not None and posted_at >= self.window_start()
+
+    def __len__(self):
+        window_start = self.window_start()
+        return sum(1 for posted_at in self.posted.values() if posted_at >= window_start)
+
+    def add_many(self, links, posted_at=None):
+        """Buffer links as posted; they count for dedupe immediately and are written on flush()"""
+        if posted_at is None:
+            posted_at = time.time()
+        with self.lock:
+            for link in links:
+                key = link_hash(link)
+                self.posted[key] = posted_at
+                self.pending.append((key, link, posted_at))
+
+    def flush(self):
+        """Write buffered links in one transaction"""
+        with self.lock:
+            if not self.pending:
+                return
+            rows, self.pending = self.pending, []
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO posted_links (link_hash, link, posted_at) VALUES (?, ?, ?)", rows)
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+# Open stores, keyed by database path, so repeated lookups in one process reuse them
+_stores = {}
+
+
+def get_posted_links_store(window_days=DEFAULT_DEDUPE_WINDOW_DAYS, path=POSTED_LINKS_DB):
+    """Return the shared store for a database, reopening it if the window changed
+    and otherwise refreshing it with links posted since it was last loaded"""
+    store = _stores.get(path)
+    if store is None or store.window_days != window_days:
+        if store is not None:
+            store.close()
+        store = _stores[path] = PostedLinksStore(path, window_days=window_days)
+    else:
+        store.refresh()
+    return store
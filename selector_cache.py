@@ -0,0 +1,80 @@
+import os
+import json
+
+# Persisted success statistics for each UI selector we try
+SELECTOR_STATS_FILE = 'selector_stats.json'
+
+
+class SelectorStats:
+    """Learns which selector in a fallback chain works, so the best one is tried first
+
+    Stats are kept per group (e.g. "post_button") and per selector: attempts,
+    hits and total latency of successful lookups.
+    """
+
+    def __init__(self, path=SELECTOR_STATS_FILE):
+        self.path = path
+        self.groups = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self.groups = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading selector stats: {e}")
+            self.groups = {}
+
+    def save(self):
+        """Write the stats if anything was recorded since the last save"""
+        if not self.dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.groups, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"⚠️ Error saving selector stats: {e}")
+
+    def ranked(self, group, selectors):
+        """Order selectors by smoothed hit rate, then average latency, then their original order"""
+        stats = self.groups.get(group, {})
+
+        def key(item):
+            index, selector = item
+            entry = stats.get(selector, {})
+            attempts = entry.get("attempts", 0)
+            hits = entry.get("hits", 0)
+            # Laplace smoothing: untried selectors start at 0.5 rather than 0 or 1
+            hit_rate = (hits + 1) / (attempts + 2)
+            latency = entry.get("latency", 0) / hits if hits else float("inf")
+            return (-hit_rate, latency, index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=key)]
+
+    def record(self, group, selector, success, latency=0.0):
+        """Record one attempt with a selector"""
+        entry = self.groups.setdefault(group, {}).setdefault(
+            selector, {"attempts": 0, "hits": 0, "latency": 0.0})
+        entry["attempts"] += 1
+        if success:
+            entry["hits"] += 1
+            entry["latency"] += latency
+        self.dirty = True
+
+
+# Shared stats for this process
+_selector_stats = None
+
+
+def get_selector_stats():
+    """Return the process-wide selector stats, loading them on first use"""
+    global _selector_stats
+    if _selector_stats is None:
+        _selector_stats = SelectorStats()
+    return _selector_stats
@@ -2,6 +2,7 @@ const express = require('express');
 const cors = require('cors');
 const fs = require('fs');
 const path = require('path');
+const http = require('http');
 const { spawn } = require('child_process');
 
 const app = express();
@@ -14,8 +15,13 @@ app.use(express.static('dist'));
 
 // File paths
 const CONFIG_FILE = 'bot_config.json';
-const LOG_FILE = 'tweet_log.json';
-const POSTED_LINKS_FILE = 'posted_links.txt';
+const LOG_FILE = 'tweet_log.jsonl';
+const LOG_DIR = 'tweet_logs';
+const LEGACY_LOG_FILE = 'tweet_log.json';
+const STATS_FILE = 'tweet_stats.json';
+
+// Control endpoint of `python main.py --daemon`, when it is running
+const DEFAULT_DAEMON_PORT = 8765;
 
 // Helper function to read JSON files safely
 const readJSONFile = (filePath, defaultValue = {}) => {
@@ -42,6 +48,42 @@ const writeJSONFile = (filePath, data) => {
   }
 };
 
+// Log files in chronological order: rotated segments, then the active log
+const tweetLogFiles = () => {
+  const files = [];
+  if (fs.existsSync(LOG_DIR)) {
+    fs.readdirSync(LOG_DIR)
+      .filter(name => name.startsWith('tweet_log-') && name.endsWith('.jsonl'))
+      .sort()
+      .forEach(name => files.push(path.join(LOG_DIR, name)));
+  }
+  if (fs.existsSync(LOG_FILE)) {
+    files.push(LOG_FILE);
+  }
+  return files;
+};
+
+// Read all tweet log entries from the line-delimited log
+const readTweetLogs = () => {
+  // Not yet migrated by the bot
+  const logs = readJSONFile(LEGACY_LOG_FILE, []);
+  tweetLogFiles().forEach(file => {
+    try {
+      fs.readFileSync(file, 'utf8').split('\n').forEach(line => {
+        if (!line.trim()) return;
+        try {
+          logs.push(JSON.parse(line));
+        } catch (error) {
+          // Skip a partially written line
+        }
+      });
+    } catch (error) {
+      console.error(`Error reading ${file}:`, error);
+    }
+  });
+  return logs;
+};
+
 // API Routes
 
 // Get bot configuration
@@ -62,7 +104,7 @@ app.put('/api/config', (req, res) => {
 
 // Get tweet logs
 app.get('/api/logs', (req, res) => {
-  const logs = readJSONFile(LOG_FILE, []);
+  const logs = readTweetLogs();
   // Sort by timestamp descending (newest first)
   const sortedLogs = logs.sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp));
   res.json(sortedLogs);
@@ -70,36 +112,72 @@ app.get('/api/logs', (req, res) => {
 
 // Get bot statistics
 app.get('/api/stats', (req, res) => {
-  const logs = readJSONFile(LOG_FILE, []);
-  const today = new Date().toISOString().split('T')[0];
-  
-  const todayLogs = logs.filter(log => log.timestamp.startsWith(today));
-  const successfulTweets = logs.filter(log => log.success).length;
-  const failedTweets = logs.filter(log => !log.success).length;
-  
-  // Read posted links to get total count
-  let totalPostedLinks = 0;
-  try {
-    if (fs.existsSync(POSTED_LINKS_FILE)) {
-      const content = fs.readFileSync(POSTED_LINKS_FILE, 'utf8');
-      totalPostedLinks = content.split('\n').filter(line => line.trim()).length;
-    }
-  } catch (error) {
-    console.error('Error reading posted links:', error);
+  // Summary maintained incrementally by the bot; rebuild with `python tweet_stats.py --rebuild`
+  const stats = readJSONFile(STATS_FILE, null);
+  if (!stats) {
+    return res.json({
+      totalTweets: 0,
+      todayTweets: 0,
+      successfulTweets: 0,
+      failedTweets: 0,
+      totalPostedLinks: 0,
+      successRate: 0
+    });
   }
 
+  // The bot buckets days in IST
+  const today = new Date().toLocaleDateString('en-CA', { timeZone: 'Asia/Kolkata' });
+  const todayBucket = (stats.by_day || {})[today] || {};
+
   res.json({
-    totalTweets: logs.length,
-    todayTweets: todayLogs.length,
-    successfulTweets,
-    failedTweets,
-    totalPostedLinks,
-    successRate: logs.length > 0 ? ((successfulTweets / logs.length) * 100).toFixed(1) : 0
+    totalTweets: stats.total_tweets,
+    todayTweets: todayBucket.total || 0,
+    successfulTweets: stats.successful_tweets,
+    failedTweets: stats.failed_tweets,
+    totalPostedLinks: stats.posted_links,
+    successRate: stats.total_tweets > 0 ? ((stats.successful_tweets / stats.total_tweets) * 100).toFixed(1) : 0,
+    byCategory: stats.by_category || {}
   });
 });
 
+// Ask a running bot daemon to start a run; resolves null if no daemon is listening
+const triggerDaemon = () => new Promise((resolve) => {
+  const config = readJSONFile(CONFIG_FILE, {});
+  const request = http.request({
+    host: '127.0.0.1',
+    port: config.daemon_port || DEFAULT_DAEMON_PORT,
+    path: '/trigger',
+    method: 'POST',
+    timeout: 2000
+  }, (response) => {
+    let body = '';
+    response.on('data', (chunk) => { body += chunk; });
+    response.on('end', () => {
+      try {
+        resolve({ statusCode: response.statusCode, body: JSON.parse(body) });
+      } catch (error) {
+        resolve(null);
+      }
+    });
+  });
+  request.on('timeout', () => request.destroy());
+  request.on('error', () => resolve(null));
+  request.end();
+});
+
 // Run bot manually
-app.post('/api/run-bot', (req, res) => {
+app.post('/api/run-bot', async (req, res) => {
+  // A warm daemon only needs a signal; spawn a one-off run otherwise
+  const daemon = await triggerDaemon();
+  if (daemon) {
+    const accepted = daemon.statusCode === 202;
+    return res.status(accepted ? 202 : 409).json({
+      success: accepted,
+      message: accepted ? 'Bot run triggered in daemon' : 'Bot daemon is already running',
+      status: daemon.body.status
+    });
+  }
+
   try {
     const pythonProcess = spawn('python', ['main.py'], {
       stdio: 'pipe',
@@ -158,7 +236,14 @@ app.post('/api/run-bot', (req, res) => {
 // Clear logs
 app.delete('/api/logs', (req, res) => {
   try {
-    fs.writeFileSync(LOG_FILE, '[]');
+    tweetLogFiles().forEach(file => fs.unlinkSync(file));
+    if (fs.existsSync(LEGACY_LOG_FILE)) {
+      fs.unlinkSync(LEGACY_LOG_FILE);
+    }
+    // Recomputed from the remaining history on the bot's next write
+    if (fs.existsSync(STATS_FILE)) {
+      fs.unlinkSync(STATS_FILE);
+    }
     res.json({ message: 'Logs cleared successfully' });
   } catch (error) {
     res.status(500).json({ error: 'Failed to clear logs' });
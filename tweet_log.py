@@ -0,0 +1,159 @@
+import os
+import json
+from datetime import datetime, date
+import pytz
+
+# Active append-only log, one JSON entry per line
+TWEET_LOG_FILE = 'tweet_log.jsonl'
+
+# Rotated segments of the log, named by the time they were closed
+TWEET_LOG_DIR = 'tweet_logs'
+
+# Old JSON-array log, converted into a segment on first use
+LEGACY_LOG_FILE = 'tweet_log.json'
+
+# Rotate the active log once it reaches this size (bytes) or a new day starts
+DEFAULT_ROTATE_BYTES = 1024 * 1024
+
+IST = pytz.timezone('Asia/Kolkata')
+
+
+def segment_path(when):
+    """Path of a rotated segment closed at the given datetime"""
+    name = f"tweet_log-{when.strftime('%Y%m%d-%H%M%S')}.jsonl"
+    return os.path.join(TWEET_LOG_DIR, name)
+
+
+def write_lines(path, entries, mode='a'):
+    """Write entries as JSON lines and fsync so they survive a crash"""
+    with open(path, mode, encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def rotate_if_needed(rotate_bytes=DEFAULT_ROTATE_BYTES):
+    """Move the active log into a segment if it is too large or from an earlier day"""
+    try:
+        stat = os.stat(TWEET_LOG_FILE)
+    except FileNotFoundError:
+        return
+
+    modified = datetime.fromtimestamp(stat.st_mtime, IST)
+    if stat.st_size < rotate_bytes and modified.date() == datetime.now(IST).date():
+        return
+
+    os.makedirs(TWEET_LOG_DIR, exist_ok=True)
+    try:
+        os.replace(TWEET_LOG_FILE, segment_path(modified))
+    except FileNotFoundError:
+        # Another run rotated it first
+        pass
+
+
+def migrate_legacy_log():
+    """Convert the old tweet_log.json array into a log segment, once
+
+    Returns:
+        int: Number of entries migrated
+    """
+    if not os.path.exists(LEGACY_LOG_FILE):
+        return 0
+
+    try:
+        with open(LEGACY_LOG_FILE, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except Exception as e:
+        print(f"⚠️ Error reading legacy tweet log: {e}")
+        return 0
+
+    if entries:
+        os.makedirs(TWEET_LOG_DIR, exist_ok=True)
+        first = parse_timestamp(entries[0].get("timestamp")) or datetime.now(IST)
+        write_lines(segment_path(first), entries, mode='w')
+
+    os.replace(LEGACY_LOG_FILE, LEGACY_LOG_FILE + '.migrated')
+    print(f"✅ Migrated {len(entries)} entries from {LEGACY_LOG_FILE}")
+    return len(entries)
+
+
+def append_log_entry(entry, rotate_bytes=DEFAULT_ROTATE_BYTES):
+    """Append one entry to the tweet log, rotating the active file first if needed"""
+    migrate_legacy_log()
+    rotate_if_needed(rotate_bytes)
+    write_lines(TWEET_LOG_FILE, [entry])
+
+
+def log_files():
+    """All log files in chronological order: rotated segments, then the active log"""
+    files = []
+    if os.path.isdir(TWEET_LOG_DIR):
+        files = sorted(
+            os.path.join(TWEET_LOG_DIR, name) for name in os.listdir(TWEET_LOG_DIR)
+            if name.startswith("tweet_log-") and name.endswith(".jsonl")
+        )
+    if os.path.exists(TWEET_LOG_FILE):
+        files.append(TWEET_LOG_FILE)
+    return files
+
+
+def parse_timestamp(value):
+    """Parse an entry timestamp, returning None if it is missing or malformed"""
+    try:
+        timestamp = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = IST.localize(timestamp)
+    return timestamp
+
+
+def as_datetime(value, end_of_day=False):
+    """Accept a datetime, date or ISO string as a filter bound"""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        value = datetime.combine(value, datetime.max.time() if end_of_day else datetime.min.time())
+        return IST.localize(value)
+    return parse_timestamp(value)
+
+
+def iter_log_entries(start=None, end=None, success=None):
+    """Stream tweet log entries lazily, oldest first
+
+    Args:
+        start: Only entries at or after this datetime / date / ISO string
+        end: Only entries at or before this datetime / date / ISO string
+        success: Only successful (True) or failed (False) entries
+
+    Yields:
+        dict: Log entries matching the filters
+    """
+    start = as_datetime(start)
+    end = as_datetime(end, end_of_day=True)
+
+    for path in log_files():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A crash mid-write can leave a partial last line
+                        continue
+
+                    if success is not None and bool(entry.get("success")) != success:
+                        continue
+                    if start or end:
+                        timestamp = parse_timestamp(entry.get("timestamp"))
+                        if timestamp is None:
+                            continue
+                        if start and timestamp < start:
+                            continue
+                        if end and timestamp > end:
+                            continue
+                    yield entry
+        except FileNotFoundError:
+            # Rotated away while we were listing files
+            continue
@@ -0,0 +1,142 @@
+import os
+import json
+import argparse
+from datetime import datetime
+import pytz
+from file_lock import file_lock
+from tweet_log import iter_log_entries, parse_timestamp
+
+# Aggregate counters kept up to date on every write
+TWEET_STATS_FILE = 'tweet_stats.json'
+TWEET_STATS_LOCK = TWEET_STATS_FILE + '.lock'
+
+# Plain-text history of posted links, used when rebuilding the summary
+POSTED_LINKS_FILE = 'posted_links.txt'
+
+IST = pytz.timezone('Asia/Kolkata')
+
+
+def empty_stats():
+    return {
+        "total_tweets": 0,
+        "successful_tweets": 0,
+        "failed_tweets": 0,
+        "posted_links": 0,
+        "by_day": {},
+        "by_category": {}
+    }
+
+
+def empty_bucket():
+    return {"total": 0, "successful": 0, "failed": 0, "posted_links": 0}
+
+
+def load_stats():
+    """Read the stats summary; constant time regardless of log size"""
+    if not os.path.exists(TWEET_STATS_FILE):
+        return empty_stats()
+    try:
+        with open(TWEET_STATS_FILE, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Error loading tweet stats: {e}")
+        return empty_stats()
+
+
+def save_stats(stats):
+    """Write the summary atomically so readers never see a partial file"""
+    stats["updated_at"] = datetime.now(IST).isoformat()
+    tmp_path = TWEET_STATS_FILE + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(stats, f, indent=2)
+    os.replace(tmp_path, TWEET_STATS_FILE)
+
+
+def add_tweet(stats, day, category, success):
+    """Count one tweet attempt into the running totals and its day / category buckets"""
+    outcome = "successful" if success else "failed"
+    stats["total_tweets"] += 1
+    stats[f"{outcome}_tweets"] += 1
+
+    buckets = [stats["by_day"].setdefault(day, empty_bucket())]
+    if category:
+        buckets.append(stats["by_category"].setdefault(category, empty_bucket()))
+    for bucket in buckets:
+        bucket["total"] += 1
+        bucket[outcome] += 1
+
+
+def add_posted_links(stats, day, count):
+    """Count newly posted links into the running total and their day bucket"""
+    stats["posted_links"] += count
+    stats["by_day"].setdefault(day, empty_bucket())["posted_links"] += count
+
+
+def record_tweet(log_entry):
+    """Update the summary for one tweet attempt that has already been logged"""
+    timestamp = parse_timestamp(log_entry.get("timestamp")) or datetime.now(IST)
+    day = timestamp.astimezone(IST).date().isoformat()
+    with file_lock(TWEET_STATS_LOCK):
+        if not os.path.exists(TWEET_STATS_FILE):
+            # First write: the raw logs already include this entry
+            save_stats(compute_stats())
+            return
+        stats = load_stats()
+        add_tweet(stats, day, log_entry.get("category"), log_entry.get("success"))
+        save_stats(stats)
+
+
+def record_posted_links(count, day=None):
+    """Update the summary for posted links that have already been saved"""
+    if not count:
+        return
+    if day is None:
+        day = datetime.now(IST).date().isoformat()
+    with file_lock(TWEET_STATS_LOCK):
+        if not os.path.exists(TWEET_STATS_FILE):
+            # First write: the posted links history already includes these links
+            save_stats(compute_stats())
+            return
+        stats = load_stats()
+        add_posted_links(stats, day, count)
+        save_stats(stats)
+
+
+def compute_stats():
+    """Compute the summary from scratch from the raw tweet log and posted links history"""
+    stats = empty_stats()
+
+    for entry in iter_log_entries():
+        timestamp = parse_timestamp(entry.get("timestamp"))
+        if timestamp is None:
+            continue
+        day = timestamp.astimezone(IST).date().isoformat()
+        add_tweet(stats, day, entry.get("category"), entry.get("success"))
+
+    if os.path.exists(POSTED_LINKS_FILE):
+        with open(POSTED_LINKS_FILE, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if '|' in line:
+                    add_posted_links(stats, line.split('|', 1)[0], 1)
+    return stats
+
+
+def rebuild_stats():
+    """Recompute the summary from the raw logs, e.g. if it has drifted"""
+    with file_lock(TWEET_STATS_LOCK):
+        stats = compute_stats()
+        save_stats(stats)
+    print(f"✅ Rebuilt tweet stats: {stats['total_tweets']} tweets, {stats['posted_links']} posted links")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tweet statistics summary")
+    parser.add_argument("--rebuild", action="store_true", help="recompute the summary from the raw logs")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rebuild_stats()
+    else:
+        print(json.dumps(load_stats(), indent=2))
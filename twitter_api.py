@@ -0,0 +1,135 @@
+import os
+import time
+import random
+
+# How an API error should be handled
+RATE_LIMITED = "rate_limited"   # wait for the rate-limit window to reset, then retry
+TRANSIENT = "transient"         # network / server error, retry with exponential backoff
+FATAL = "fatal"                 # credentials, permissions, duplicate or invalid tweet: don't retry
+
+# Defaults when the config doesn't set "api_retry"
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_MAX_WAIT = 900          # longest single wait in seconds before giving up
+BASE_BACKOFF = 2                # first transient retry delay in seconds
+
+
+def header(error, name):
+    """Read a response header from a tweepy HTTP error, or None"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return headers.get(name)
+
+
+def classify_error(error, attempt):
+    """Classify an error from create_tweet and work out how long to wait before retrying
+
+    Args:
+        error: Exception raised by the client
+        attempt: Number of attempts made so far (1 for the first)
+
+    Returns:
+        tuple: (RATE_LIMITED / TRANSIENT / FATAL, seconds to wait before the next attempt)
+    """
+    import tweepy
+    import requests
+
+    if isinstance(error, tweepy.TooManyRequests):
+        reset = header(error, "x-rate-limit-reset")
+        try:
+            wait = max(0, int(reset) - time.time()) + 1
+        except (TypeError, ValueError):
+            wait = 60
+        return RATE_LIMITED, wait
+
+    backoff = BASE_BACKOFF * 2 ** (attempt - 1) + random.uniform(0, 1)
+    if isinstance(error, tweepy.TwitterServerError) or isinstance(error, requests.RequestException):
+        retry_after = header(error, "retry-after")
+        try:
+            return TRANSIENT, max(float(retry_after), backoff)
+        except (TypeError, ValueError):
+            return TRANSIENT, backoff
+    if isinstance(error, tweepy.HTTPException) and getattr(error.response, "status_code", None) == 408:
+        return TRANSIENT, backoff
+    return FATAL, 0
+
+
+class TwitterApiClient:
+    """Long-lived v2 API client; its requests session keeps the HTTPS connection open between posts"""
+
+    def __init__(self, consumer_key, consumer_secret, access_token, access_token_secret):
+        import tweepy
+
+        self.client = tweepy.Client(
+            consumer_key=consumer_key,
+            consumer_secret=consumer_secret,
+            access_token=access_token,
+            access_token_secret=access_token_secret,
+            wait_on_rate_limit=False
+        )
+
+    def create_tweet(self, tweet_text, max_attempts=DEFAULT_MAX_ATTEMPTS, max_wait=DEFAULT_MAX_WAIT):
+        """Post a tweet, retrying rate-limited and transient errors
+
+        Returns:
+            tuple: (posted, fatal) - fatal is True when the error won't go away by retrying
+        """
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response = self.client.create_tweet(text=tweet_text)
+                tweet_id = (response.data or {}).get("id")
+                print(f"✅ Tweet posted successfully via API! (id {tweet_id})")
+                return True, False
+            except Exception as e:
+                kind, wait = classify_error(e, attempt)
+                print(f"⚠️ API post attempt {attempt}/{max_attempts} failed ({kind}): {e}")
+                if kind == FATAL:
+                    return False, True
+                if attempt == max_attempts:
+                    break
+                if wait > max_wait:
+                    print(f"⚠️ Next retry would be in {wait:.0f}s, over the {max_wait}s limit; giving up")
+                    break
+                print(f"⏳ Retrying in {wait:.0f}s")
+                time.sleep(wait)
+
+        print("❌ Giving up on API post for now")
+        return False, False
+
+
+# Client shared by every post in this process
+_api_client = None
+
+
+def get_api_client():
+    """Return the process-wide API client, building it on first use
+
+    Raises:
+        ImportError: If tweepy isn't installed
+        ValueError: If the API credentials aren't set
+    """
+    global _api_client
+    if _api_client is None:
+        credentials = [os.getenv("TWITTER_API_KEY"), os.getenv("TWITTER_API_SECRET"),
+                       os.getenv("TWITTER_ACCESS_TOKEN"), os.getenv("TWITTER_ACCESS_TOKEN_SECRET")]
+        if not all(credentials):
+            raise ValueError("Twitter API credentials not found in environment variables")
+        _api_client = TwitterApiClient(*credentials)
+    return _api_client
+
+
+def post_with_api(tweet_text, max_attempts=DEFAULT_MAX_ATTEMPTS, max_wait=DEFAULT_MAX_WAIT):
+    """Post a tweet through the shared API client
+
+    Returns:
+        tuple: (posted, fatal) - callers should only switch to another posting
+        method when fatal is True
+    """
+    try:
+        client = get_api_client()
+    except ImportError:
+        print("⚠️ tweepy not installed. Install with 'pip install tweepy' to use API method")
+        return False, True
+    except ValueError as e:
+        print(f"❌ Error posting tweet via API: {e}")
+        return False, True
+    return client.create_tweet(tweet_text, max_attempts=max_attempts, max_wait=max_wait)
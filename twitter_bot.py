@@ -1,90 +1,366 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_resolver import resolve_chromedriver, invalidate_pin
+from selector_cache import get_selector_stats
+from debug_capture import get_debug_capture
+from twitter_api import post_with_api
 import time
 import os
+import re
+import json
 from dotenv import load_dotenv
 
+try:
+    # Optional: only used to report the browser's memory use
+    import psutil
+except ImportError:
+    psutil = None
+
 load_dotenv()
 
+# Selenium is imported by load_selenium() the first time a browser is needed,
+# so API-only and empty runs don't pay for it
+webdriver = By = Keys = Service = WebDriverWait = EC = Options = ActionChains = None
+TimeoutException = StaleElementReferenceException = SessionNotCreatedException = None
+
+def load_selenium():
+    """Import Selenium into this module's globals on first use"""
+    global webdriver, By, Keys, Service, WebDriverWait, EC, Options, ActionChains
+    global TimeoutException, StaleElementReferenceException, SessionNotCreatedException
+    if webdriver is not None:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, SessionNotCreatedException
+
 # Get Twitter credentials from environment variables
 TWITTER_USERNAME = os.getenv("TWITTER_USERNAME")
 TWITTER_PASSWORD = os.getenv("TWITTER_PASSWORD")
 TWITTER_EMAIL = os.getenv("TWITTER_EMAIL")  
 
-def handle_login_verification(driver, wait, email=None):
-    """Handle verification step during Twitter login where email needs to be entered
+# Cookies from the last successful login, restored so later launches can skip the login flow
+COOKIE_FILE = 'twitter_cookies.json'
+
+# Browser performance profiles; pick one with "browser_profile" and tweak it with "browser_options"
+BROWSER_PROFILES = {
+    # Visible, maximized Chrome that loads everything, as when posting by hand
+    "default": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "block_resources": False,
+        "window_size": None,
+        "low_memory": False
+    },
+    # Headless Chrome that stops at DOMContentLoaded and skips images, media and fonts
+    "light": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "block_resources": True,
+        "window_size": "1280,900",
+        "low_memory": True
+    }
+}
+
+# URL patterns blocked via CDP when a profile has block_resources enabled
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif",
+    "*.mp4", "*.webm", "*.m3u8", "*.m4s",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*video.twimg.com*", "*pbs.twimg.com/media*"
+]
+
+# Posting settings, overridable from the bot config via configure_bot()
+SETTINGS = {
+    # Browser performance profile name and per-option overrides
+    "browser_profile": "default",
+    "browser_options": {},
+    
+    # Saved login sessions older than this are discarded and a fresh login is done
+    "session_max_age_days": 14,
+    
+    # API posting retries: attempts per tweet and the longest wait (seconds) allowed between them
+    "api_retry": {"max_attempts": 4, "max_wait": 900},
+    
+    # Screenshot / DOM capture: level ("off", "failure", "verbose"), max_files and max_mb
+    "debug_capture": {"level": "failure"},
+    
+    # Upper bound in seconds for each condition-based wait in the Selenium flow
+    "wait_timeouts": {
+        "auth_probe": 8,          # home timeline or login flow reached with saved cookies
+        "login_page": 20,         # username field visible
+        "after_username": 15,     # password field or verification challenge shown
+        "password_field": 15,     # password field shown after a challenge
+        "login_complete": 20,     # home timeline reached
+        "compose_button": 15,     # a way to open the composer is clickable
+        "composer": 15,           # tweet composer open
+        "post_button": 10,        # Post button enabled
+        "post_confirmation": 15   # success / error toast shown or composer closed/cleared
+    }
+}
+
+# How long each wait actually took during the current post: (name, seconds, condition met)
+WAIT_TIMINGS = []
+
+def configure_bot(config):
+    """Apply posting settings from the bot config"""
+    for key in SETTINGS:
+        if key not in config:
+            continue
+        if isinstance(SETTINGS[key], dict):
+            SETTINGS[key] = dict(SETTINGS[key], **config[key])
+        else:
+            SETTINGS[key] = config[key]
+
+def debug_capture(driver, step, failure=False):
+    """Capture the page for debugging if the configured level asks for it"""
+    return get_debug_capture(SETTINGS["debug_capture"]).capture(driver, step, failure)
+
+def browser_profile():
+    """The configured browser profile with any per-option overrides applied"""
+    profile = BROWSER_PROFILES.get(SETTINGS["browser_profile"])
+    if profile is None:
+        print(f"⚠️ Unknown browser profile '{SETTINGS['browser_profile']}', using default")
+        profile = BROWSER_PROFILES["default"]
+    return dict(profile, **SETTINGS["browser_options"])
+
+def page_load_time(driver):
+    """Seconds the current page took to load (DOMContentLoaded when load never finished)"""
+    try:
+        ms = driver.execute_script("""
+            var nav = performance.getEntriesByType('navigation')[0];
+            if (!nav) return null;
+            return nav.loadEventEnd > 0 ? nav.loadEventEnd : nav.domContentLoadedEventEnd;
+        """)
+        return ms / 1000 if ms else None
+    except Exception:
+        return None
+
+class PostMetrics:
+    """Page-load time and peak browser memory collected while posting one tweet"""
+    
+    def __init__(self, session):
+        self.session = session
+        self.page_load = None
+        self.peak_rss = None
+    
+    def sample(self):
+        """Record the browser's current memory use, keeping the peak"""
+        rss = self.session.memory_rss()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+    
+    def report(self):
+        """Print this post's metrics, tagged with the profile, to compare browser profiles"""
+        page_load = f"{self.page_load:.2f}s" if self.page_load is not None else "n/a"
+        if self.peak_rss is not None:
+            peak_rss = f"{self.peak_rss / (1024 * 1024):.0f} MB"
+        else:
+            peak_rss = "n/a (install psutil)"
+        print(f"📊 Post metrics ({SETTINGS['browser_profile']} profile): page load {page_load}, peak RSS {peak_rss}")
+
+def timed_wait(driver, name, condition):
+    """Wait for a DOM condition, bounded by its configured timeout, and record how long it took
     
     Args:
         driver: Selenium WebDriver instance
-        wait: WebDriverWait instance
-        email: Email address to use for verification
+        name: Key into SETTINGS["wait_timeouts"]
+        condition: Callable taking the driver, as for WebDriverWait.until
     
     Returns:
-        bool: True if verification was handled, False if no verification found
+        The condition's truthy result
+    
+    Raises:
+        TimeoutException: If the condition isn't met within the timeout
+    """
+    timeout = SETTINGS["wait_timeouts"].get(name, 10)
+    started = time.monotonic()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=0.2,
+                               ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+        WAIT_TIMINGS.append((name, time.monotonic() - started, True))
+        return result
+    except Exception:
+        WAIT_TIMINGS.append((name, time.monotonic() - started, False))
+        raise
+
+def report_wait_timings():
+    """Print and reset the waits recorded for the current post"""
+    if WAIT_TIMINGS:
+        parts = [f"{name} {seconds:.1f}s" + ("" if met else " (timed out)")
+                 for name, seconds, met in WAIT_TIMINGS]
+        print("⏱️ Waits: " + ", ".join(parts))
+    WAIT_TIMINGS.clear()
+
+def first_clickable(selectors):
+    """Wait condition returning (element, selector) for the first visible, enabled match among CSS selectors"""
+    def condition(driver):
+        for selector in selectors:
+            for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                if element.is_displayed() and element.is_enabled():
+                    return element, selector
+        return False
+    return condition
+
+def post_button_enabled(driver):
+    """Wait condition: the composer's Post button is visible and enabled"""
+    buttons = driver.find_elements(
+        By.CSS_SELECTOR, "[data-testid='tweetButton'], [data-testid='tweetButtonInline']")
+    return any(button.is_displayed() and button.get_attribute("aria-disabled") != "true"
+               for button in buttons)
+
+# Text of the toast shown after a successful post; X shows its errors in the same toast
+POST_SENT_TOAST = re.compile(r"your (post|tweet) was sent", re.IGNORECASE)
+
+def post_confirmed(driver):
+    """Wait condition for the outcome of clicking Post
+    
+    Returns:
+        tuple: ("posted", None) once the success toast shows or the composer
+        closed / was cleared, ("rejected", toast text) for any other toast,
+        False while neither has happened
+    """
+    for toast in driver.find_elements(By.CSS_SELECTOR, "[data-testid='toast']"):
+        text = toast.text.strip()
+        if POST_SENT_TOAST.search(text):
+            return "posted", None
+        if text:
+            return "rejected", text
+    boxes = driver.find_elements(By.CSS_SELECTOR, "div[data-testid='tweetTextarea_0']")
+    if not boxes or all(not box.text.strip() for box in boxes):
+        return "posted", None
+    return False
+
+# Login flow states, detected in one round trip by LOGIN_STATE_SCRIPT
+LOGIN_STATES = ("username", "challenge", "password", "authenticated", "unknown")
+
+# For each state we act on: the wait to use afterwards and the states that wait accepts
+LOGIN_TRANSITIONS = {
+    "username": ("after_username", ("challenge", "password", "authenticated")),
+    "challenge": ("password_field", ("password", "authenticated")),
+    "password": ("login_complete", ("authenticated", "challenge"))
+}
+
+# Most steps a login may take before we give up (username, two challenges, password...)
+MAX_LOGIN_STEPS = 5
+
+# Returns the current login state from a few targeted element checks instead of
+# serializing the whole page; challenge text is only matched against headings
+LOGIN_STATE_SCRIPT = """
+function visible(selector) {
+    var elements = document.querySelectorAll(selector);
+    for (var i = 0; i < elements.length; i++) {
+        if (elements[i].offsetWidth || elements[i].offsetHeight) return true;
+    }
+    return false;
+}
+if (location.pathname.indexOf('/home') === 0 ||
+    document.querySelector("a[data-testid='AppTabBar_Home_Link']")) return 'authenticated';
+if (visible("input[type='password']")) return 'password';
+if (visible("input[data-testid='ocfEnterTextTextInput']")) return 'challenge';
+if (visible("input[name='text']")) {
+    var headings = document.querySelectorAll("h1, [role='heading']"), text = '';
+    for (var i = 0; i < headings.length; i++) text += ' ' + headings[i].textContent;
+    text = text.toLowerCase();
+    if (text.indexOf('verify your identity') !== -1 ||
+        text.indexOf('phone number or email') !== -1) return 'challenge';
+}
+if (visible("input[autocomplete='username']")) return 'username';
+return 'unknown';
+"""
+
+def detect_login_state(driver):
+    """Current step of the login flow, one of LOGIN_STATES"""
+    try:
+        state = driver.execute_script(LOGIN_STATE_SCRIPT)
+    except Exception:
+        return "unknown"
+    return state if state in LOGIN_STATES else "unknown"
+
+def login_state_in(states):
+    """Wait condition returning the login state once it is one of the given states"""
+    def condition(driver):
+        state = detect_login_state(driver)
+        return state if state in states else False
+    return condition
+
+def answer_challenge(driver, email=None):
+    """Answer the "verify your identity" challenge by entering the account email
+    
+    Args:
+        driver: Selenium WebDriver instance
+        email: Email address to use for verification
     """
     if not email:
         email = TWITTER_EMAIL
-        
-    try:
-        # Check if we're on a verification page by looking for specific text
-        verification_texts = [
-            "Enter your Phone number or Email address",
-            "Enter your phone number or email address",
-            "verify your identity",
-            "Verify your identity"
-        ]
-        
-        # Simple check for any verification texts on the page
-        page_source = driver.page_source.lower()
-        is_verification_page = any(text.lower() in page_source for text in verification_texts)
-        
-        if is_verification_page:
-            print("✅ Detected verification page")
-            
-            # Simply use ActionChains to type the email directly - no need to find the input field
-            # since focus is already on the input field
-            time.sleep(1)  # Short pause to ensure page is ready
-            
-            # Clear any existing text first (using keyboard shortcuts)
-            actions = ActionChains(driver)
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
-            time.sleep(0.5)
-            actions.send_keys(Keys.DELETE).perform()
-            time.sleep(0.5)
-            
-            # Type the email address
-            actions = ActionChains(driver)
-            actions.send_keys(email).perform()
-            print(f"✅ Entered email: {email}")
-            
-            # Press Enter to submit
-            time.sleep(0.5)
-            actions = ActionChains(driver)
-            actions.send_keys(Keys.RETURN).perform()
-            print("✅ Submitted email verification with Enter key")
-            
-            # Wait for processing
-            time.sleep(3)
-            return True
-        
-        return False  # No verification page detected
     
-    except Exception as e:
-        print(f"⚠️ Error handling verification: {e}")
-        # Take a screenshot for debugging
-        try:
-            driver.save_screenshot("verification_error.png")
-            print("✅ Saved error screenshot as 'verification_error.png'")
-        except:
-            pass
-        return False
+    fields = driver.find_elements(
+        By.CSS_SELECTOR, "input[data-testid='ocfEnterTextTextInput'], input[name='text']")
+    input_field = next((field for field in fields if field.is_displayed()), None)
+    
+    if input_field is not None:
+        input_field.clear()
+        input_field.send_keys(email)
+        input_field.send_keys(Keys.RETURN)
+    else:
+        # Focus is normally already on the input, so type into the page directly
+        actions = ActionChains(driver)
+        actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
+        actions.send_keys(Keys.DELETE).perform()
+        ActionChains(driver).send_keys(email).send_keys(Keys.RETURN).perform()
+    print(f"✅ Submitted email verification: {email}")
+
+# XPath selectors for the Post button, tried in learned order
+POST_BUTTON_SELECTORS = [
+    # Primary selectors based on your screenshot
+    "//span[text()='Post']/ancestor::div[@role='button' and not(@aria-disabled='true')]",
+    "//div[@data-testid='tweetButton']",
+    "//div[@aria-label='Post' and @role='button']",
+    
+    # Broader fallback selectors
+    "//div[@role='button'][.//span[text()='Post']]",
+    "//div[contains(@data-testid, 'tweet') and contains(@data-testid, 'Button')]",
+    "//div[@role='button'][contains(text(), 'Post')]"
+]
+
+# CSS selectors for opening the composer, tried in learned order
+COMPOSE_SELECTORS = [
+    "a[data-testid='SideNav_NewTweet_Button']",    # older UI
+    "a[data-testid='FloatingActionButton_Tweet']",  # newer UI
+    "div[data-testid='tweetTextarea_0'], div[role='textbox']"  # inline composer on the homepage
+]
+
+# Scores every visible, enabled button in one pass and clicks the most Post-like one
+POST_BUTTON_SCAN_SCRIPT = """
+var best = null, bestScore = 0;
+var buttons = document.querySelectorAll('[role="button"], button');
+for (var i = 0; i < buttons.length; i++) {
+    var button = buttons[i];
+    if (button.offsetWidth === 0 || button.offsetHeight === 0 ||
+        button.getAttribute('aria-disabled') === 'true' ||
+        window.getComputedStyle(button).display === 'none') {
+        continue;
+    }
+    var text = (button.textContent || '').trim().toLowerCase();
+    var testid = button.getAttribute('data-testid') || '';
+    var score = 0;
+    if (testid === 'tweetButton' || testid === 'tweetButtonInline') score += 100;
+    if ((button.getAttribute('aria-label') || '').toLowerCase() === 'post') score += 50;
+    if (text === 'post') score += 40;
+    else if (text.indexOf('post') !== -1) score += 10;
+    if (score > 0 && button.closest('[role="dialog"]')) score += 5;
+    if (score > bestScore) {
+        best = button;
+        bestScore = score;
+    }
+}
+if (!best) return null;
+best.click();
+return {score: bestScore, testid: best.getAttribute('data-testid') || '', text: (best.textContent || '').trim()};
+"""
 
 def find_and_click_post_button(driver, wait):
     """
@@ -97,378 +373,435 @@ def find_and_click_post_button(driver, wait):
     Returns:
         bool: True if button was clicked successfully
     """
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-    import time
-    
-    # Take a screenshot for debugging
-    debug_screenshot = "twitter_debug.png"
-    driver.save_screenshot(debug_screenshot)
-    print(f"✅ Saved debug screenshot as '{debug_screenshot}'")
-    
-    # List of all possible selectors for the Post button
-    post_button_selectors = [
-        # Primary selectors based on your screenshot
-        "//span[text()='Post']/ancestor::div[@role='button' and not(@aria-disabled='true')]",
-        "//div[@data-testid='tweetButton']",
-        "//div[@aria-label='Post' and @role='button']",
-        
-        # Broader fallback selectors
-        "//div[@role='button'][.//span[text()='Post']]",
-        "//div[contains(@data-testid, 'tweet') and contains(@data-testid, 'Button')]",
-        "//div[@role='button'][contains(text(), 'Post')]"
-    ]
-    
-    # Try each selector
-    for selector in post_button_selectors:
+    debug_capture(driver, "before_post_button")
+    
+    # Try selectors in the order that has worked best before
+    selector_stats = get_selector_stats()
+    for selector in selector_stats.ranked("post_button", POST_BUTTON_SELECTORS):
+        started = time.monotonic()
+        clicked = False
         try:
             print(f"Trying selector: {selector}")
             elements = driver.find_elements(By.XPATH, selector)
             
             # If elements found, try clicking the first visible one
-            if elements:
-                for button in elements:
-                    if button.is_displayed():
-                        print(f"✅ Found visible Post button with selector: {selector}")
-                        # Try regular click first
+            for button in elements:
+                if button.is_displayed():
+                    print(f"✅ Found visible Post button with selector: {selector}")
+                    # Try regular click first
+                    try:
+                        button.click()
+                        print("✅ Regular click successful!")
+                        clicked = True
+                    except Exception as e:
+                        print(f"Regular click failed: {e}")
+                        
+                        # Try JavaScript click as fallback
                         try:
-                            button.click()
-                            print("✅ Regular click successful!")
-                            time.sleep(2)
-                            return True
-                        except Exception as e:
-                            print(f"Regular click failed: {e}")
-                            
-                            # Try JavaScript click as fallback
-                            try:
-                                driver.execute_script("arguments[0].click();", button)
-                                print("✅ JavaScript click successful!")
-                                time.sleep(2)
-                                return True
-                            except Exception as js_error:
-                                print(f"JavaScript click failed: {js_error}")
+                            driver.execute_script("arguments[0].click();", button)
+                            print("✅ JavaScript click successful!")
+                            clicked = True
+                        except Exception as js_error:
+                            print(f"JavaScript click failed: {js_error}")
+                    if clicked:
+                        break
         except Exception as e:
             print(f"Error with selector {selector}: {e}")
+        
+        selector_stats.record("post_button", selector, clicked, time.monotonic() - started)
+        if clicked:
+            selector_stats.save()
+            return True
     
-    # If all selectors fail, try the nuclear option: scan all buttons for "Post" text
-    try:
-        print("Trying nuclear option: scanning all buttons for 'Post' text")
-        all_buttons = driver.find_elements(By.XPATH, "//div[@role='button']")
-        for button in all_buttons:
-            try:
-                if button.is_displayed() and "post" in button.text.lower():
-                    print("✅ Found button with 'Post' text in scan")
-                    driver.execute_script("arguments[0].click();", button)
-                    print("✅ Nuclear option click successful!")
-                    time.sleep(2)
-                    return True
-            except Exception:
-                continue
-    except Exception as e:
-        print(f"Nuclear option failed: {e}")
-    
-    # If still no success, try direct JavaScript approach
+    # If all selectors fail, rank every visible button in one script call and click the best
+    started = time.monotonic()
     try:
-        print("Trying JavaScript direct DOM manipulation")
-        script = """
-        var buttons = document.querySelectorAll('[role="button"]');
-        for (var i = 0; i < buttons.length; i++) {
-            var buttonText = buttons[i].textContent || '';
-            if (buttonText.toLowerCase().includes('post') && 
-                window.getComputedStyle(buttons[i]).display !== 'none' &&
-                buttons[i].offsetWidth > 0 && 
-                buttons[i].offsetHeight > 0) {
-                buttons[i].click();
-                return true;
-            }
-        }
-        return false;
-        """
-        result = driver.execute_script(script)
-        if result:
-            print("✅ JavaScript DOM manipulation successful!")
-            time.sleep(2)
+        print("Trying DOM scan for the best Post button candidate")
+        match = driver.execute_script(POST_BUTTON_SCAN_SCRIPT)
+        if match:
+            print(f"✅ DOM scan clicked button (score {match['score']}, "
+                  f"testid '{match['testid']}', text '{match['text']}')")
+            selector_stats.record("post_button", "dom_scan", True, time.monotonic() - started)
+            selector_stats.save()
             return True
         else:
-            print("❌ JavaScript DOM manipulation couldn't find Post button")
+            print("❌ DOM scan couldn't find Post button")
     except Exception as e:
-        print(f"JavaScript direct approach failed: {e}")
+        print(f"DOM scan failed: {e}")
+    selector_stats.record("post_button", "dom_scan", False)
+    selector_stats.save()
     
     # If we get here, all automated methods failed
     print("❌ All automated methods to find Post button failed")
     
-    # Take another screenshot and ask for manual intervention
-    driver.save_screenshot("twitter_failed_final.png")
+    # Capture the page and ask for manual intervention
+    screenshot = debug_capture(driver, "post_button_failed", failure=True)
     print("\n" + "="*50)
     print("MANUAL INTERVENTION REQUIRED:")
-    print(f"Screenshot saved as 'twitter_failed_final.png'")
+    if screenshot:
+        print(f"Screenshot saved as '{screenshot}'")
     print("Please click the Post button manually in the browser window")
     input("Press Enter after clicking the Post button (or to continue)...")
     print("="*50 + "\n")
     
     return False
 
-def handle_verification_between_steps(driver, wait, email=None):
-    """Handle verification step that appears between username and password pages
+class BrowserSession:
+    """Long-lived Chrome session that stays logged in across posts
     
-    Args:
-        driver: Selenium WebDriver instance
-        wait: WebDriverWait instance
-        email: Email address to use for verification
-    
-    Returns:
-        bool: True if verification was handled, False if no verification found
+    The driver is health-checked before each use and only relaunched
+    (and logged in again) when it has died.
     """
-    if not email:
-        email = TWITTER_EMAIL
+    
+    def __init__(self):
+        self.driver = None
+        self.logged_in = False
+    
+    def launch(self):
+        """Start a fresh Chrome instance using the configured performance profile"""
+        load_selenium()
+        profile = browser_profile()
         
-    try:
-        # Check if we're on a verification page by looking for specific text
-        # Take a screenshot for debugging
-        driver.save_screenshot("verification_check.png")
-        print("✅ Saved verification check screenshot")
+        # Set up Chrome options
+        options = Options()
+        options.add_argument("--disable-notifications")
+        if profile["window_size"]:
+            options.add_argument(f"--window-size={profile['window_size']}")
+        else:
+            options.add_argument("--start-maximized")
         
-        # Check if the page contains verification text
-        verification_texts = [
-            "Enter your Phone number or Email address",
-            "Enter your phone number or email address",
-            "verify your identity",
-            "Verify your identity"
-        ]
+        if profile["headless"]:
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
         
-        # Simple check for any verification texts on the page
-        page_source = driver.page_source.lower()
-        is_verification_page = any(text.lower() in page_source for text in verification_texts)
+        # Hand control back at DOMContentLoaded instead of waiting for every resource
+        options.page_load_strategy = profile["page_load_strategy"]
         
-        if is_verification_page:
-            print("✅ Detected verification page between username and password steps")
-            
-            # Try to find the input field first
-            try:
-                # Try common input field selectors
-                input_selectors = [
-                    "input[name='text']", 
-                    "input[type='text']",
-                    "input[autocomplete='username']"
-                ]
-                
-                input_field = None
-                for selector in input_selectors:
-                    try:
-                        input_field = driver.find_element(By.CSS_SELECTOR, selector)
-                        if input_field.is_displayed():
-                            print(f"✅ Found input field with selector: {selector}")
-                            break
-                    except:
-                        continue
-                
-                if input_field and input_field.is_displayed():
-                    # Clear and enter email
-                    input_field.clear()
-                    input_field.send_keys(email)
-                    print(f"✅ Entered email: {email}")
-                    input_field.send_keys(Keys.RETURN)
-                    print("✅ Submitted email with Enter key")
-                    time.sleep(2)
-                    return True
-            except Exception as e:
-                print(f"⚠️ Error finding input field: {e}")
-            
-            # If input field not found, try direct keyboard input
-            print("⚠️ Input field not found, trying direct keyboard input")
-            actions = ActionChains(driver)
-            
-            # Clear any existing text first
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).perform()
-            time.sleep(0.5)
-            actions.send_keys(Keys.DELETE).perform()
-            time.sleep(0.5)
-            
-            # Type the email
-            actions = ActionChains(driver)
-            actions.send_keys(email).perform()
-            print(f"✅ Entered email via ActionChains: {email}")
-            
-            # Submit with Enter
-            time.sleep(0.5)
-            actions = ActionChains(driver)
-            actions.send_keys(Keys.RETURN).perform()
-            print("✅ Submitted with Enter via ActionChains")
-            
-            # Wait for processing
-            time.sleep(3)
-            return True
+        if profile["low_memory"]:
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--renderer-process-limit=2")
+            options.add_argument("--disable-features=Translate,MediaRouter")
         
-        print("❌ No verification page detected between username and password steps")
+        if profile["block_resources"]:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        
+        # Setup Chrome driver with the pinned chromedriver, resolving it only when needed
+        try:
+            self.driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+        except SessionNotCreatedException as e:
+            # Usually Chrome updated past the pinned driver: re-resolve once and retry
+            print(f"⚠️ Chrome rejected the pinned chromedriver, re-resolving: {e.msg}")
+            invalidate_pin()
+            self.driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+        self.logged_in = False
+        
+        if profile["block_resources"]:
+            # Drop images, video and fonts at the network layer before they are requested
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        
+        print(f"✅ Launched browser session ({SETTINGS['browser_profile']} profile)")
+    
+    def memory_rss(self):
+        """Resident memory of chromedriver and all Chrome processes it started, in bytes (None without psutil)"""
+        if psutil is None or self.driver is None:
+            return None
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            total = 0
+            for process in [root] + root.children(recursive=True):
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total
+        except Exception:
+            return None
+    
+    def is_alive(self):
+        """Cheap health check: the browser still answers and has a window open"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.execute_script("return 1")
+            return bool(self.driver.window_handles)
+        except Exception:
+            return False
+    
+    def get_driver(self):
+        """Return a live driver, relaunching the browser only if it has died"""
+        if not self.is_alive():
+            if self.driver is not None:
+                print("⚠️ Browser session died, relaunching")
+                self.close()
+            self.launch()
+        return self.driver
+    
+    def close(self):
+        """Quit the browser if it is running"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+        self.logged_in = False
+
+# Shared session reused by every Selenium post in this process
+_browser_session = None
+
+def get_browser_session():
+    """Return the process-wide browser session, creating it on first use"""
+    global _browser_session
+    if _browser_session is None:
+        _browser_session = BrowserSession()
+    return _browser_session
+
+def close_browser_session():
+    """Shut down the shared browser session, e.g. at the end of a run"""
+    if _browser_session is not None:
+        _browser_session.close()
+    # Let queued debug captures reach disk before the process exits
+    get_debug_capture(SETTINGS["debug_capture"]).flush()
+
+def save_session_cookies(driver):
+    """Save the logged-in session's cookies so later launches can reuse it"""
+    try:
+        with open(COOKIE_FILE, 'w') as f:
+            json.dump({"saved_at": time.time(), "cookies": driver.get_cookies()}, f)
+        print("✅ Saved login session")
+    except Exception as e:
+        print(f"⚠️ Error saving login session: {e}")
+
+def invalidate_saved_session():
+    """Forget the saved login session, e.g. after Twitter rejected it"""
+    if os.path.exists(COOKIE_FILE):
+        os.remove(COOKIE_FILE)
+
+def restore_session_cookies(driver):
+    """Load saved cookies into the browser
+    
+    Returns:
+        bool: True if a saved, unexpired session was restored
+    """
+    if not os.path.exists(COOKIE_FILE):
         return False
     
+    try:
+        with open(COOKIE_FILE, 'r') as f:
+            saved = json.load(f)
     except Exception as e:
-        print(f"⚠️ Error handling verification between steps: {e}")
-        # Take a screenshot for debugging
-        try:
-            driver.save_screenshot("verification_error.png")
-            print("✅ Saved error screenshot as 'verification_error.png'")
-        except:
-            pass
+        print(f"⚠️ Error reading saved login session: {e}")
+        invalidate_saved_session()
         return False
+    
+    max_age = SETTINGS["session_max_age_days"] * 24 * 60 * 60
+    if time.time() - saved.get("saved_at", 0) > max_age:
+        print("⚠️ Saved login session is too old, logging in again")
+        invalidate_saved_session()
+        return False
+    
+    # Cookies can only be set for the domain currently loaded; robots.txt is the lightest page there
+    driver.get("https://x.com/robots.txt")
+    restored = 0
+    now = time.time()
+    for cookie in saved.get("cookies", []):
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        try:
+            driver.add_cookie(cookie)
+            restored += 1
+        except Exception:
+            # Cookie for another domain
+            continue
+    return restored > 0
 
+def on_login_page(driver):
+    """True if Twitter sent the browser to the login flow"""
+    return "/login" in driver.current_url or "/i/flow" in driver.current_url
 
-def tweet_with_selenium(tweet_text):
-    """Post a tweet using Selenium automation"""
-    # Set up Chrome options
-    options = Options()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-notifications")
-    
-    # Uncomment to run in headless mode for production
-    # options.add_argument("--headless")
-    # options.add_argument("--disable-gpu")
-    # options.add_argument("--no-sandbox")
-    # options.add_argument("--disable-dev-shm-usage")
+def is_authenticated(driver):
+    """Quick probe: load the home timeline and see whether we land on it or on the login flow"""
+    driver.get("https://x.com/home")
     
-    # Setup Chrome driver with service
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    def probe(d):
+        if on_login_page(d):
+            return "login"
+        if d.find_elements(By.CSS_SELECTOR, "a[data-testid='AppTabBar_Home_Link'], a[data-testid='SideNav_NewTweet_Button']"):
+            return "home"
+        return False
     
     try:
-        # Open Twitter login page
-        driver.get("https://twitter.com/i/flow/login")
-        wait = WebDriverWait(driver, 20)
-        
-        # Check if we need to log in or if we're already logged in
-        if TWITTER_USERNAME and TWITTER_PASSWORD:
-            try:
-                # Wait for and enter username
-                username_field = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "input[autocomplete='username']")))
-                username_field.send_keys(TWITTER_USERNAME)
-                username_field.send_keys(Keys.RETURN)
-                
-                # Wait a moment for the next screen to load
-                time.sleep(3)
-                
-                # Check if verification page appears here (between username and password)
-                if handle_verification_between_steps(driver, wait, TWITTER_EMAIL):
-                    print("✅ Completed email verification step")
-                    time.sleep(3)  # Wait for the next page after verification
-                
-                # Now enter password (which should be the next step after username or verification)
-                password_field = wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "input[type='password']")))
-                password_field.send_keys(TWITTER_PASSWORD)
-                password_field.send_keys(Keys.RETURN)
-                
-                print("✅ Successfully entered credentials")
-                time.sleep(5)  # Wait for login to proceed
+        return timed_wait(driver, "auth_probe", probe) == "home"
+    except Exception:
+        return False
+
+def ensure_logged_in(driver, wait):
+    """Reuse the saved login session if Twitter still accepts it, otherwise log in and save a new one"""
+    if restore_session_cookies(driver):
+        if is_authenticated(driver):
+            print("✅ Restored saved login session")
+            return
+        print("⚠️ Saved login session was rejected, logging in again")
+        invalidate_saved_session()
+        driver.delete_all_cookies()
+    
+    log_in(driver, wait)
+    if is_authenticated(driver):
+        save_session_cookies(driver)
+
+def log_in(driver, wait):
+    """Log in to Twitter with the credentials from the environment"""
+    # Open Twitter login page
+    driver.get("https://twitter.com/i/flow/login")
+    
+    # Check if we need to log in or if we're already logged in
+    if TWITTER_USERNAME and TWITTER_PASSWORD:
+        try:
+            # Walk the flow: username -> optional challenge -> password -> authenticated
+            state = timed_wait(driver, "login_page", login_state_in(("username", "authenticated")))
+            for _ in range(MAX_LOGIN_STEPS):
+                if state == "authenticated":
+                    break
                 
-                print("✅ Login sequence completed")
-                time.sleep(5)  # Wait for login to complete
+                if state == "username":
+                    username_field = driver.find_element(By.CSS_SELECTOR, "input[autocomplete='username']")
+                    username_field.send_keys(TWITTER_USERNAME)
+                    username_field.send_keys(Keys.RETURN)
+                elif state == "challenge":
+                    print("✅ Detected verification challenge")
+                    answer_challenge(driver, TWITTER_EMAIL)
+                elif state == "password":
+                    password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+                    password_field.send_keys(TWITTER_PASSWORD)
+                    password_field.send_keys(Keys.RETURN)
+                    print("✅ Successfully entered credentials")
                 
-            except Exception as e:
-                print(f"⚠️ Login automation failed: {e}")
-                print("➡️ Please log in manually if needed...")
-                input("Press Enter after you've logged into Twitter...")
-        else:
-            print("⚠️ Twitter credentials not found in environment variables")
-            print("➡️ Please log in manually...")
+                wait_name, next_states = LOGIN_TRANSITIONS[state]
+                state = timed_wait(driver, wait_name, login_state_in(next_states))
+            
+            if state != "authenticated":
+                raise RuntimeError(f"login stuck in state '{state}'")
+            print("✅ Login sequence completed")
+            
+        except Exception as e:
+            print(f"⚠️ Login automation failed in state '{detect_login_state(driver)}': {e}")
+            screenshot = debug_capture(driver, "login_failed", failure=True)
+            if screenshot:
+                print(f"✅ Saved error screenshot as '{screenshot}'")
+            print("➡️ Please log in manually if needed...")
             input("Press Enter after you've logged into Twitter...")
+    else:
+        print("⚠️ Twitter credentials not found in environment variables")
+        print("➡️ Please log in manually...")
+        input("Press Enter after you've logged into Twitter...")
+
+def tweet_with_selenium(tweet_text, session=None):
+    """Post a tweet using Selenium automation
+    
+    Args:
+        tweet_text (str): The text to tweet
+        session (BrowserSession): Session to post through; defaults to the shared one
+    
+    Returns:
+        bool: True only if the post was confirmed by a toast or the composer closing
+    """
+    load_selenium()
+    if session is None:
+        session = get_browser_session()
+    driver = session.get_driver()
+    metrics = PostMetrics(session)
+    metrics.sample()
+    
+    try:
+        wait = WebDriverWait(driver, 20)
         
-        # Rest of the function remains the same
-        # Navigate to home page
-        driver.get("https://twitter.com/home")
-        time.sleep(3)
-        
-        # Find and click the tweet composer directly
-        try:
-            # Try first with the navigation button (older UI)
-            post_button = wait.until(EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, "a[data-testid='SideNav_NewTweet_Button']")))
-            post_button.click()
-        except Exception:
-            try:
-                # Try with the fixed position compose button (newer UI)
-                post_button = wait.until(EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "a[data-testid='FloatingActionButton_Tweet']")))
-                post_button.click()
-            except Exception:
-                # Try clicking directly on the input field if it's visible on the homepage
-                tweet_box = wait.until(EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "div[data-testid='tweetTextarea_0'], div[role='textbox']")))
-                tweet_box.click()
+        selector_stats = get_selector_stats()
+        for attempt in range(2):
+            # Log in only once per browser session, reusing a saved login when possible
+            if not session.logged_in:
+                ensure_logged_in(driver, wait)
+                session.logged_in = True
+            
+            # Navigate to home page, unless the login probe already left us there
+            if "/home" not in driver.current_url:
+                driver.get("https://x.com/home")
+            metrics.page_load = page_load_time(driver)
+            
+            # Open the composer, trying the control that has worked best before first
+            if not on_login_page(driver):
+                started = time.monotonic()
+                try:
+                    compose_button, selector = timed_wait(driver, "compose_button", first_clickable(
+                        selector_stats.ranked("compose_button", COMPOSE_SELECTORS)))
+                    break
+                except TimeoutException:
+                    # A slow page with the session still valid: fail this post, keep the saved login
+                    if attempt or detect_login_state(driver) == "authenticated":
+                        raise
+            elif attempt:
+                raise RuntimeError("sent to the login flow again right after logging in")
+            
+            # The session expired or was revoked while the browser stayed open: log in again once
+            print("⚠️ Login session is no longer valid, logging in again")
+            session.logged_in = False
+            invalidate_saved_session()
+            driver.delete_all_cookies()
+        selector_stats.record("compose_button", selector, True, time.monotonic() - started)
+        selector_stats.save()
+        compose_button.click()
         
-        # Wait for the tweet composer to be visible
-        time.sleep(2)
+        # Wait for the tweet composer to be visible, then enter the text
+        tweet_box = timed_wait(driver, "composer", EC.visibility_of_element_located(
+            (By.CSS_SELECTOR, "div[data-testid='tweetTextarea_0']")))
+        tweet_box.send_keys(tweet_text)
+        metrics.sample()
+        debug_capture(driver, "composer_filled")
         
-        # Enter tweet text - try multiple possible selectors
+        # The Post button enables once the text has been registered
         try:
-            tweet_box = wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div[data-testid='tweetTextarea_0']")))
-            tweet_box.send_keys(tweet_text)
-        except Exception:
-            # Alternative selector for newer Twitter UI
-            tweet_box = wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div[role='textbox'][data-testid='tweetTextarea_0']")))
-            tweet_box.send_keys(tweet_text)
-        
-        time.sleep(1)  # Give time for the text to be entered
+            timed_wait(driver, "post_button", post_button_enabled)
+        except TimeoutException:
+            print("⚠️ Post button didn't report enabled, trying anyway")
         
         # ---- USE NEW POST BUTTON FUNCTION ----
         post_button_clicked = find_and_click_post_button(driver, wait)
+        if not post_button_clicked:
+            print("⚠️ Post button may not have been clicked properly, checking for a manual post")
         
-        # Wait for tweet to be posted
-        time.sleep(5)
-        
-        if post_button_clicked:
-            print("✅ Tweet posted successfully!")
-            return True
-        else:
-            print("⚠️ Post button may not have been clicked properly")
-            # Assume the user manually clicked the button if we got here
-            print("Assuming tweet was posted manually")
-            return True
+        # Only the success toast or a closed composer counts as posted; anything else stays retryable
+        try:
+            outcome, message = timed_wait(driver, "post_confirmation", post_confirmed)
+        except TimeoutException:
+            print("❌ No post confirmation seen, treating the tweet as not posted")
+            debug_capture(driver, "post_unconfirmed", failure=True)
+            return False
+        if outcome == "rejected":
+            print(f"❌ Twitter rejected the post: {message}")
+            debug_capture(driver, "post_rejected", failure=True)
+            return False
+        print("✅ Tweet posted successfully!")
+        return True
         
     except Exception as e:
         print(f"❌ Error posting tweet: {e}")
+        debug_capture(driver, "post_error", failure=True)
         return False
     finally:
-        driver.quit()
+        metrics.sample()
+        metrics.report()
+        report_wait_timings()
 
 # Function to handle Twitter API posting (alternative approach)
 def tweet_with_api(tweet_text):
     """
-    Post a tweet using the Twitter API
+    Post a tweet using the Twitter API v2, through a client shared across posts
     Note: This requires Twitter API access and authentication
     """
-    try:
-        # Import tweepy only when needed to avoid dependencies if not used
-        import tweepy
-        
-        # Get credentials from environment
-        consumer_key = os.getenv("TWITTER_API_KEY")
-        consumer_secret = os.getenv("TWITTER_API_SECRET")
-        access_token = os.getenv("TWITTER_ACCESS_TOKEN")
-        access_token_secret = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-        
-        # Check if credentials exist
-        if not all([consumer_key, consumer_secret, access_token, access_token_secret]):
-            raise ValueError("Twitter API credentials not found in environment variables")
-        
-        # Authenticate and create API client
-        auth = tweepy.OAuth1UserHandler(
-            consumer_key, consumer_secret, access_token, access_token_secret
-        )
-        api = tweepy.API(auth)
-        
-        # Post tweet
-        api.update_status(tweet_text)
-        print("✅ Tweet posted successfully via API!")
-        return True
-        
-    except ImportError:
-        print("⚠️ tweepy not installed. Install with 'pip install tweepy' to use API method")
-        return False
-    except Exception as e:
-        print(f"❌ Error posting tweet via API: {e}")
-        return False
+    posted, _ = post_with_api(tweet_text, **SETTINGS["api_retry"])
+    return posted
 
 def post_tweet(tweet_text, method='selenium'):
     """
@@ -483,11 +816,13 @@ def post_tweet(tweet_text, method='selenium'):
     """
     if method == 'api':
         # Try API method first if selected
-        success = tweet_with_api(tweet_text)
-        if success:
+        posted, fatal = post_with_api(tweet_text, **SETTINGS["api_retry"])
+        if posted:
             return True
         
-        # Fall back to Selenium if API fails
+        # Rate limits and outages pass; only a fatal error is worth a browser launch
+        if not fatal:
+            return False
         print("⚠️ Falling back to Selenium method...")
     
     # Use Selenium method
@@ -497,7 +832,29 @@ def post_tweet(tweet_text, method='selenium'):
         print(f"❌ Tweet posting failed: {e}")
         return False
 
+def post_tweets(tweet_texts, method='selenium', delay=0):
+    """
+    Post several tweets through one browser session
+    
+    Args:
+        tweet_texts (list): The texts to tweet, in order
+        method (str): 'selenium' (default) or 'api'
+        delay (int): Seconds to wait between tweets
+    
+    Returns:
+        list: True/False per tweet
+    """
+    results = []
+    for i, tweet_text in enumerate(tweet_texts):
+        if i > 0 and delay:
+            time.sleep(delay)
+        results.append(post_tweet(tweet_text, method=method))
+    return results
+
 if __name__ == "__main__":
     # Test the tweeting functionality
     test_tweet = "Hello World #TwitterBot #Python #Testing"
-    post_tweet(test_tweet)
\ No newline at end of file
+    try:
+        post_tweet(test_tweet)
+    finally:
+        close_browser_session()
\ No newline at end of file